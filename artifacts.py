@@ -0,0 +1,83 @@
+import json
+import os
+import re
+from pathlib import Path
+import timing
+
+ARTIFACTS_DIR = os.environ.get("LIBRARY_ARTIFACTS_DIR", "artifacts")
+
+_DOM_JS = """
+const html = id => { const el = document.getElementById(id); return el ? el.outerHTML : null; };
+const active = document.activeElement;
+return {
+    url: location.href,
+    title: document.title,
+    active: active ? active.outerHTML.slice(0, 500) : null,
+    parts: ['tableHeader', 'tableBody', 'authorModal', 'bookModal', 'dropdown'].map(id => [id, html(id)]),
+};
+"""
+
+
+def _dom(drv):
+    dom = drv.execute_script(_DOM_JS)
+    lines = [f"<!-- {dom['url']} | {dom['title']} -->", f"<!-- activeElement: {dom['active']} -->"]
+    for part, html in dom["parts"]:
+        lines.append(f"<!-- #{part} -->")
+        lines.append(html if html is not None else "<!-- не знайдено -->")
+    return "\n".join(lines)
+
+
+def _timeline(drv, test):
+    commands = [
+        {"at": started, "command": command, "params": params, "seconds": seconds, "status": status}
+        for started, command, params, seconds, status in getattr(drv, "command_log", ())
+    ]
+    # Під pytest кроки прив'язані до nodeid поточного тесту; під чистим unittest їх немає.
+    current = timing.current_test() or test
+    steps = [r for r in timing.RECORDS if r["test"] == current and r["kind"] != "command"]
+    return {"commands": commands, "steps": steps}
+
+
+def capture(drv, test, directory=None):
+    """
+    Зберігає стан браузера після збою тесту в <directory>/<test>/: screenshot.png, dom.html
+    (#tableHeader, #tableBody, модальні вікна, меню), console.json і timeline.json (останні
+    команди WebDriver з drv.command_log і кроки тесту з timing.RECORDS).
+
+    Кожна частина знімається окремо: якщо браузер упав разом з тестом, решта все одно
+    записується, а помилки потрапляють у timeline.json. Повертає шлях до каталогу.
+    """
+    target = Path(directory or ARTIFACTS_DIR) / re.sub(r"[^\w.-]+", "_", test).strip("_")
+    target.mkdir(parents=True, exist_ok=True)
+    errors = {}
+
+    try:
+        drv.save_screenshot(str(target / "screenshot.png"))
+    except Exception as e:
+        errors["screenshot"] = str(e)
+    try:
+        (target / "dom.html").write_text(_dom(drv), encoding="utf-8")
+    except Exception as e:
+        errors["dom"] = str(e)
+    try:
+        # get_log віддає записи з часу попереднього виклику, тобто щонайбільше з минулого збою.
+        console = drv.get_log("browser")
+    except Exception as e:
+        console = []
+        errors["console"] = str(e)
+
+    (target / "console.json").write_text(json.dumps(console, ensure_ascii=False, indent=2), encoding="utf-8")
+    timeline = _timeline(drv, test)
+    timeline["errors"] = errors
+    (target / "timeline.json").write_text(json.dumps(timeline, ensure_ascii=False, indent=2), encoding="utf-8")
+    return str(target)
+
+
+def failed(test_case):
+    """
+    unittest: чи впав уже тест. Викликати з tearDown, поки браузер ще не повернуто в пул.
+
+    Працює і під unittest, і під pytest, бо обидва виконують TestCase.run.
+    """
+    outcome = getattr(test_case, "_outcome", None)
+    return outcome is not None and not outcome.success
@@ -0,0 +1,210 @@
+"""
+Навантажувальні заміри таблиці бібліотеки: pytest bench.py [--bench-sizes 1000,10000,100000].
+
+Для кожного розміру каталогу N (каталог нарощується від меншого N до більшого в одному
+браузері, тож тести йдуть групами за N) міряється час від натискання клавіші в mainInput
+або кліку по заголовку "Рік" до моменту, коли #tableBody перестає змінюватись. Час рахується в самому браузері
+(MutationObserver), тому затримки WebDriver у результат не потрапляють.
+
+Перцентилі порівнюються з базовою лінією (--bench-baseline); тест падає, якщо p50 або p90
+гірші за базові більш ніж на --bench-tolerance. --bench-update-baseline перезаписує базу.
+"""
+import json
+import math
+import os
+import random
+import statistics
+import pytest
+from selenium.webdriver.common.by import By
+from pages import SET_VALUE_JS
+from registry import TEST_MARKER
+from seed import seed_authors, seed_books
+from stats import slope
+from waits import find
+
+SETTLE_QUIET_MS = 100
+SETTLE_TIMEOUT_MS = 60000
+SEED_CHUNK = 500
+SCRIPT_TIMEOUT = 3600
+
+_ARM_JS = """
+const body = document.getElementById('tableBody');
+const state = window.__bench = {start: null, last: null};
+state.observer = new MutationObserver(() => { state.last = performance.now(); });
+state.observer.observe(body, {childList: true, subtree: true, characterData: true});
+state.onEvent = () => { state.start = performance.now(); state.last = null; };
+document.addEventListener('keydown', state.onEvent, true);
+document.addEventListener('click', state.onEvent, true);
+"""
+
+_COLLECT_JS = """
+const [quiet, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const state = window.__bench;
+const finish = value => {
+    state.observer.disconnect();
+    document.removeEventListener('keydown', state.onEvent, true);
+    document.removeEventListener('click', state.onEvent, true);
+    done(value);
+};
+(function check() {
+    const now = performance.now();
+    if (state.start === null) finish(null);
+    else if (state.last !== null && now - state.last >= quiet) finish(state.last - state.start);
+    else if (now - state.start > timeout) finish(state.last === null ? 0 : state.last - state.start);
+    else setTimeout(check, 5);
+})();
+"""
+
+_PREFILL_JS = SET_VALUE_JS + "setValue(arguments[0], arguments[1]);"
+
+RESULTS = {}
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = sorted({int(s) for s in metafunc.config.getoption("--bench-sizes").split(",")})
+        # scope="module" групує тести за розміром: search[N], sort[N], потім наступний N.
+        metafunc.parametrize("size", sizes, scope="module")
+
+
+def percentiles(samples):
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p90": cuts[89], "p99": cuts[98], "max": max(samples)}
+
+
+def regressions(current, baseline, tolerance):
+    """Перцентилі з current, що гірші за baseline більш ніж на tolerance (частка)."""
+    return [
+        f"{key}: {current[key]:.1f}ms > {baseline[key]:.1f}ms * {1 + tolerance:g}"
+        for key in ("p50", "p90")
+        if key in baseline and current[key] > baseline[key] * (1 + tolerance)
+    ]
+
+
+def growth_exponent(points):
+    """
+    Показник k у p50 ~ N^k за методом найменших квадратів у log-log масштабі.
+
+    k ~ 1 -- лінійна деградація, k > 1 -- гірша за лінійну. None, якщо розмірів менше двох.
+    """
+    return slope([(math.log(n), math.log(p50)) for n, p50 in points if p50 > 0])
+
+
+def _measure(drv, action):
+    drv.execute_script(_ARM_JS)
+    action()
+    latency = drv.execute_async_script(_COLLECT_JS, SETTLE_QUIET_MS, SETTLE_TIMEOUT_MS)
+    assert latency is not None, "Дія не викликала подію keydown/click на сторінці"
+    return latency
+
+
+class Catalogue:
+    """
+    Каталог, що нарощується до потрібного розміру: Bench_<TEST_MARKER>_000000 ... з детермінованими роками.
+
+    Записи не реєструються для registry.cleanup (поштучне видалення десятків тисяч рядків
+    довше за сам замір); на довгоживучому екземплярі їх прибирає --sweep.
+    """
+
+    def __init__(self, drv):
+        self.drv = drv
+        self.books = 0
+        self.authors = []
+
+    def grow(self, size):
+        if self.books > size:
+            # Каталог не зменшується: замір на більшому каталозі записався б як N=size.
+            pytest.skip(f"Каталог уже має {self.books} книг > N={size}")
+        authors_needed = max(1, size // 100)
+        new_authors = [f"BenchAuthor_{TEST_MARKER}_{i:04d}" for i in range(len(self.authors), authors_needed)]
+        for i in range(0, len(new_authors), SEED_CHUNK):
+            chunk = new_authors[i:i + SEED_CHUNK]
+            seed_authors(self.drv, [{"first": name, "last": "Bench", "email": f"{name}@bench.test"} for name in chunk],
+                         tracked=False)
+        self.authors += new_authors
+
+        for start in range(self.books, size, SEED_CHUNK):
+            stop = min(start + SEED_CHUNK, size)
+            seed_books(self.drv, [
+                {"title": self.title(i), "year": random.Random(i).randint(1500, 2025),
+                 "author": self.authors[i % len(self.authors)]}
+                for i in range(start, stop)
+            ], tracked=False)
+        self.books = max(self.books, size)
+
+    @staticmethod
+    def title(i):
+        return f"Bench_{TEST_MARKER}_{i:06d}"
+
+
+@pytest.fixture(scope="module")
+def catalogue(browser, url):
+    # Браузер спільний для сесії: після bench решта тестів отримує попередній тайм-аут скриптів.
+    previous = browser.timeouts.script
+    browser.set_script_timeout(SCRIPT_TIMEOUT)
+    try:
+        browser.get(url)
+        yield Catalogue(browser)
+    finally:
+        browser.set_script_timeout(previous)
+
+
+@pytest.fixture(scope="module")
+def baseline(request):
+    path = request.config.getoption("--bench-baseline")
+    data = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    yield data
+
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None and RESULTS:
+        reporter.write_sep("=", "bench: затримка рендерингу #tableBody, мс")
+        for (scenario, size), stats in sorted(RESULTS.items()):
+            reporter.write_line(f"{scenario:<7} N={size:<7} " + "  ".join(f"{k} {v:8.1f}" for k, v in stats.items()))
+        for scenario in sorted({scenario for scenario, _ in RESULTS}):
+            k = growth_exponent([(size, stats["p50"]) for (name, size), stats in RESULTS.items() if name == scenario])
+            if k is not None:
+                reporter.write_line(f"{scenario:<7} p50 ~ N^{k:.2f}")
+    if request.config.getoption("--bench-update-baseline") and RESULTS:
+        for (scenario, size), stats in RESULTS.items():
+            data.setdefault(scenario, {})[str(size)] = stats
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+
+def _check(request, baseline, scenario, size, samples):
+    stats = percentiles(samples)
+    RESULTS[scenario, size] = stats
+    if request.config.getoption("--bench-update-baseline"):
+        return
+    expected = baseline.get(scenario, {}).get(str(size))
+    if expected is None:
+        pytest.skip(f"Немає базової лінії для {scenario} N={size}; запустіть з --bench-update-baseline")
+    problems = regressions(stats, expected, request.config.getoption("--bench-tolerance"))
+    assert not problems, f"Регресія {scenario} N={size}: " + "; ".join(problems)
+
+
+def test_search_latency(request, catalogue, baseline, size):
+    catalogue.grow(size)
+    drv = catalogue.drv
+    inp = find(drv, By.ID, "mainInput")
+    rnd = random.Random(size)
+    samples = []
+    for _ in range(request.config.getoption("--bench-repeats")):
+        query = catalogue.title(rnd.randrange(size))
+        drv.execute_script(_PREFILL_JS, inp, query[:-1])
+        samples.append(_measure(drv, lambda: inp.send_keys(query[-1])))
+    drv.execute_script(_PREFILL_JS, inp, "")
+    _check(request, baseline, "search", size, samples)
+
+
+def test_sort_latency(request, catalogue, baseline, size):
+    catalogue.grow(size)
+    drv = catalogue.drv
+    # Заголовок шукається щоразу: застосунок може перемальовувати #tableHeader під час сортування.
+    click = lambda: find(drv, By.XPATH, "//th[contains(., 'Рік')]").click()
+    samples = [_measure(drv, click) for _ in range(request.config.getoption("--bench-repeats"))]
+    _check(request, baseline, "sort", size, samples)
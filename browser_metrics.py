@@ -0,0 +1,155 @@
+import functools
+import os
+import threading
+import weakref
+from collections import defaultdict
+from timing import current_test
+
+# Вимкнено за замовчуванням: кожна дія коштує ще чотири команди (два CDP і два execute_script).
+# Вмикається через --browser-metrics або LIBRARY_BROWSER_METRICS=1.
+ENABLED = bool(os.environ.get("LIBRARY_BROWSER_METRICS"))
+
+METRICS = []
+
+# Лічильники CDP Performance.getMetrics: ім'я в записі -> (метрика, множник).
+_COUNTERS = {
+    "layouts": ("LayoutCount", 1),
+    "style_recalcs": ("RecalcStyleCount", 1),
+    "layout_ms": ("LayoutDuration", 1000),
+    "recalc_ms": ("RecalcStyleDuration", 1000),
+    "script_ms": ("ScriptDuration", 1000),
+    "task_ms": ("TaskDuration", 1000),
+}
+_GAUGES = {
+    "heap_used": "JSHeapUsedSize",
+    "nodes": "Nodes",
+    "listeners": "JSEventListeners",
+}
+
+# Збирає long tasks (> 50 мс) з моменту завантаження документа. Встановлюється через
+# Page.addScriptToEvaluateOnNewDocument, тож переживає drv.get().
+_PROBE_JS = """
+if (!window.__perfProbe) {
+    const probe = window.__perfProbe = {longTasks: 0, longTaskMs: 0};
+    try {
+        new PerformanceObserver(list => {
+            for (const e of list.getEntries()) { probe.longTasks++; probe.longTaskMs += e.duration; }
+        }).observe({type: 'longtask', buffered: true});
+    } catch (e) {}
+}
+"""
+
+_READ_JS = """
+const probe = window.__perfProbe || {longTasks: 0, longTaskMs: 0};
+const nav = performance.getEntriesByType('navigation')[0];
+return {
+    origin: performance.timeOrigin,
+    long_tasks: probe.longTasks,
+    long_task_ms: probe.longTaskMs,
+    navigation: nav ? {
+        ttfb_ms: nav.responseStart - nav.startTime,
+        dom_interactive_ms: nav.domInteractive,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+        load_ms: nav.loadEventEnd,
+        transfer_bytes: nav.transferSize,
+    } : null,
+};
+"""
+
+_installed = weakref.WeakSet()
+_local = threading.local()
+_lock = threading.Lock()
+
+
+def _install(drv):
+    if drv in _installed:
+        return
+    drv.execute_cdp_cmd("Performance.enable", {})
+    drv.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _PROBE_JS})
+    drv.execute_script(_PROBE_JS)
+    _installed.add(drv)
+
+
+def sample(drv):
+    """Поточні значення: метрики CDP Performance.getMetrics і лічильники сторінки."""
+    _install(drv)
+    cdp = {m["name"]: m["value"] for m in drv.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+    page = drv.execute_script(_READ_JS)
+    page["cdp"] = cdp
+    return page
+
+
+def gauges(drv, collect_garbage=True):
+    """
+    Розмір JS heap, кількість вузлів DOM і обробників подій; з collect_garbage -- після
+    примусового GC (HeapProfiler.collectGarbage), щоб вимірювалось лише те, що справді утримується.
+    """
+    _install(drv)
+    if collect_garbage:
+        drv.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    cdp = {m["name"]: m["value"] for m in drv.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+    return {key: cdp.get(name, 0) for key, name in _GAUGES.items()}
+
+
+def diff(before, after):
+    """
+    Різниця двох sample(). Якщо між ними була навігація (змінився performance.timeOrigin),
+    лічильники нового документа беруться повністю і додається його Navigation Timing.
+    """
+    navigated = before["origin"] != after["origin"]
+    delta = {}
+    for key, (name, scale) in _COUNTERS.items():
+        value = after["cdp"].get(name, 0)
+        if not navigated:
+            value = max(value - before["cdp"].get(name, 0), 0)
+        delta[key] = round(value * scale, 3)
+    for key in ("long_tasks", "long_task_ms"):
+        value = after[key] if navigated else after[key] - before[key]
+        delta[key] = round(value, 3)
+    for key, name in _GAUGES.items():
+        delta[key] = after["cdp"].get(name, 0)
+    delta["heap_delta"] = after["cdp"].get("JSHeapUsedSize", 0) - before["cdp"].get("JSHeapUsedSize", 0)
+    if navigated and after["navigation"]:
+        delta["navigation"] = after["navigation"]
+    return delta
+
+
+def measured(func=None, *, name=None):
+    """
+    Декоратор для хелперів drv-першим-аргументом: записує в METRICS, що дія коштувала
+    браузеру (layout, recalc style, скрипти, long tasks, heap). Вкладені дії не дублюються.
+    """
+    if func is None:
+        return functools.partial(measured, name=name)
+
+    @functools.wraps(func)
+    def wrapper(drv, *args, **kwargs):
+        if not ENABLED or getattr(_local, "active", False):
+            return func(drv, *args, **kwargs)
+        _local.active = True
+        try:
+            before = sample(drv)
+            result = func(drv, *args, **kwargs)
+            record = {"test": current_test(), "action": name or func.__name__}
+            record.update(diff(before, sample(drv)))
+            with _lock:
+                METRICS.append(record)
+            return result
+        finally:
+            _local.active = False
+    return wrapper
+
+
+def for_test(nodeid):
+    return [r for r in METRICS if r["test"] == nodeid]
+
+
+def by_action(records=None):
+    """{action: {"count", <сума кожного лічильника>}} -- для підсумку прогону."""
+    totals = defaultdict(lambda: defaultdict(float))
+    for r in METRICS if records is None else records:
+        t = totals[r["action"]]
+        t["count"] += 1
+        for key in list(_COUNTERS) + ["long_tasks", "long_task_ms"]:
+            t[key] += r[key]
+    return {action: dict(t) for action, t in totals.items()}
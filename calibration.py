@@ -0,0 +1,95 @@
+import os
+import statistics
+import threading
+import time
+import waits
+from pages import MENU_ITEM_JS
+from timing import timed
+
+# Швидкість середовища, під яку підібрані базові тайм-аути в waits.py.
+REFERENCE = {"load_ms": 1000.0, "render_ms": 100.0, "roundtrip_ms": 10.0}
+MIN_SCALE = 0.5
+MAX_SCALE = 5.0
+
+# LIBRARY_TIMEOUT_SCALE (або --timeout-scale) фіксує waits.SCALE і вимикає калібрування.
+FIXED = "LIBRARY_TIMEOUT_SCALE" in os.environ
+RESULT = None
+
+_lock = threading.Lock()
+
+_LOAD_JS = "const n = performance.getEntriesByType('navigation')[0]; return n ? n.loadEventEnd : null;"
+
+# Перемикає вкладки "Автори"/"Книги" і міряє, скільки триває перемальовування, поки DOM
+# не затихне на quiet мс. Пункти меню натискаються напряму, без відкриття меню.
+_RENDER_JS = MENU_ITEM_JS + """
+const [repeats, quiet, limit] = arguments;
+const done = arguments[arguments.length - 1];
+const once = text => new Promise((ok, fail) => {
+    const target = menuItem(text);
+    if (!target) { fail(new Error(`menu item "${text}" not found`)); return; }
+    const t0 = performance.now();
+    let last = null;
+    const observer = new MutationObserver(() => { last = performance.now(); });
+    observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+    target.click();
+    (function tick() {
+        const now = performance.now();
+        if ((last !== null && now - last >= quiet) || now - t0 > limit) {
+            observer.disconnect();
+            ok((last ?? now) - t0);
+        } else setTimeout(tick, 5);
+    })();
+});
+(async () => {
+    const samples = [];
+    for (let i = 0; i < repeats; i++) {
+        samples.push(await once('Автори'));
+        samples.push(await once('Книги'));
+    }
+    return samples;
+})().then(done, e => done(String(e)));
+"""
+
+
+def fix(scale):
+    """Задає множник вручну; calibrate() після цього нічого не міряє."""
+    global FIXED
+    waits.SCALE, FIXED = scale, True
+
+
+def measure(drv, url, repeats=3):
+    """
+    Медіани в мс: load_ms -- loadEventEnd з Navigation Timing після drv.get(url),
+    render_ms -- перемальовування таблиці при зміні вкладки, roundtrip_ms -- порожня команда WebDriver.
+    """
+    drv.get(url)
+    load = drv.execute_script(_LOAD_JS) or 0.0
+
+    trips = []
+    for _ in range(repeats * 2):
+        t0 = time.perf_counter()
+        drv.execute_script("return 1;")
+        trips.append((time.perf_counter() - t0) * 1000)
+
+    renders = drv.execute_async_script(_RENDER_JS, repeats, 50, 10000)
+    if isinstance(renders, str):
+        raise RuntimeError(f"Calibration failed: {renders}")
+    return {"load_ms": load, "render_ms": statistics.median(renders), "roundtrip_ms": statistics.median(trips)}
+
+
+@timed
+def calibrate(drv, url, repeats=3):
+    """
+    Один раз на процес міряє середовище (measure) і задає waits.SCALE: найбільше з відношень
+    виміряного до REFERENCE, обмежене [MIN_SCALE, MAX_SCALE]. Повертає RESULT
+    (виміри і scale) або None, якщо множник зафіксовано.
+    """
+    global RESULT
+    with _lock:
+        if FIXED or RESULT is not None:
+            return RESULT
+        measured = measure(drv, url, repeats)
+        ratio = max(measured[key] / REFERENCE[key] for key in REFERENCE)
+        waits.SCALE = min(max(ratio, MIN_SCALE), MAX_SCALE)
+        RESULT = dict(measured, scale=waits.SCALE)
+        return RESULT
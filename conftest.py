@@ -0,0 +1,280 @@
+import argparse
+import random
+import unittest
+import pytest
+import artifacts
+import browser_metrics
+import calibration
+import scheduler
+import timing
+from helper import unique_name
+from seed import seed_books
+from session import LibrarySession
+
+
+def _bench_repeats(value):
+    repeats = int(value)
+    if repeats < 2:
+        raise argparse.ArgumentTypeError(f"{value}: percentiles need at least 2 samples")
+    return repeats
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("library")
+    group.addoption("--app-url", default=None, help="URL вже запущеного застосунку (або LIBRARY_URL)")
+    group.addoption("--app-dir", default=None,
+                    help="каталог з index.html; застосунок піднімається локально на вільному порту (або LIBRARY_APP_DIR)")
+    group.addoption("--step-timings", default=None, metavar="PATH",
+                    help="записати час кожного кроку і тесту у PATH (.json або .csv)")
+    group.addoption("--slowest-steps", type=int, default=10, metavar="N",
+                    help="показати N найповільніших кроків у підсумку (0 -- вимкнути)")
+    group.addoption("--browser-metrics", action="store_true",
+                    help="знімати метрики браузера (layout, long tasks, heap, Navigation Timing) навколо кожної дії "
+                         "хелперів і додавати їх до звіту тесту (або LIBRARY_BROWSER_METRICS=1)")
+    group.addoption("--artifacts-dir", default=artifacts.ARTIFACTS_DIR, metavar="DIR",
+                    help="куди зберігати скріншот, DOM, консоль і хронологію команд тестів, що впали "
+                         "(або LIBRARY_ARTIFACTS_DIR)")
+    group.addoption("--timeout-scale", type=float, default=None, metavar="X",
+                    help="множник базових тайм-аутів замість калібрування на старті (або LIBRARY_TIMEOUT_SCALE)")
+    group.addoption("--sweep", action="store_true",
+                    help="перед тестами видалити залишки попередніх прогонів з міткою registry.TEST_MARKER в імені")
+
+    sched = parser.getgroup("library-schedule", "розподіл і порядок тестів")
+    sched.addoption("--shard", default=None, metavar="K/N",
+                    help="запустити K-й з N шардів, збалансованих за історичною тривалістю тестів")
+    sched.addoption("--durations-from", default=None, metavar="PATH",
+                    help="JSON з попереднього --step-timings; без нього всі тести вважаються однаково довгими")
+    sched.addoption("--longest-first", action="store_true",
+                    help="запускати найдовші групи першими (корисно з pytest-xdist -n)")
+    sched.addoption("--random-order", nargs="?", const="random", default=None, metavar="SEED",
+                    help="перемішати порядок тестів (seed друкується в заголовку) для пошуку прихованих залежностей")
+
+    bench = parser.getgroup("library-bench", "bench.py: заміри затримки таблиці")
+    bench.addoption("--bench-sizes", default="1000,10000", help="розміри каталогу через кому, напр. 1000,10000,100000")
+    bench.addoption("--bench-repeats", type=_bench_repeats, default=20,
+                    help="замірів на сценарій і розмір (щонайменше 2 -- для перцентилів)")
+    bench.addoption("--bench-baseline", default="bench_baseline.json", metavar="PATH", help="файл базової лінії")
+    bench.addoption("--bench-tolerance", type=float, default=0.2, help="допустиме погіршення p50/p90, частка")
+    bench.addoption("--bench-update-baseline", action="store_true", help="записати поточні результати як базову лінію")
+
+    soak = parser.getgroup("library-soak", "soak.py: витоки пам'яті за тривалої роботи сторінки")
+    soak.addoption("--soak-cycles", type=int, default=1000, help="циклів додати/редагувати/видалити книгу")
+    soak.addoption("--soak-warmup", type=int, default=50, help="циклів до першого виміру (прогрів JIT і кешів)")
+    soak.addoption("--soak-sample-every", type=int, default=50, help="вимірювати heap і DOM кожні N циклів")
+    soak.addoption("--soak-max-heap-slope", type=float, default=1024, help="допустимий приріст JS heap, байт/цикл")
+    soak.addoption("--soak-max-node-slope", type=float, default=0.5, help="допустимий приріст вузлів DOM за цикл")
+    soak.addoption("--soak-max-listener-slope", type=float, default=0.5,
+                   help="допустимий приріст обробників подій за цикл")
+
+
+def pytest_configure(config):
+    timing.patch_sleep()
+    config.calibrations = []
+    if config.getoption("--timeout-scale") is not None:
+        calibration.fix(config.getoption("--timeout-scale"))
+    if config.getoption("--browser-metrics"):
+        browser_metrics.ENABLED = True
+    config.addinivalue_line("markers", "library(data=()): спільні дані тесту; тести зі спільними даними "
+                                       "плануються разом і не розносяться по шардах/воркерах")
+    workerinput = getattr(config, "workerinput", None)
+    value = config.getoption("--random-order")
+    if workerinput is not None:
+        config.random_order_seed = workerinput.get("random_order_seed")
+    elif value is None:
+        config.random_order_seed = None
+    else:
+        config.random_order_seed = random.randrange(10 ** 6) if value == "random" else int(value)
+
+    shard = config.getoption("--shard")
+    try:
+        config.shard = scheduler.parse_shard(shard) if shard else None
+    except ValueError:
+        raise pytest.UsageError(f"--shard {shard}: expected K/N with 1 <= K <= N, e.g. --shard 2/4") from None
+
+
+def pytest_unconfigure(config):
+    # time.sleep підмінюється лише на час сесії pytest, а не для решти процесу.
+    timing.unpatch_sleep()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # Воркери xdist мають зібрати тести в тому самому порядку, що й контролер.
+    node.workerinput["random_order_seed"] = node.config.random_order_seed
+
+
+def pytest_report_header(config):
+    if config.random_order_seed is not None:
+        return f"random order seed: {config.random_order_seed} (відтворити: --random-order {config.random_order_seed})"
+
+
+def pytest_collection_modifyitems(config, items):
+    durations = scheduler.load_durations(config.getoption("--durations-from"))
+    units = scheduler.units(items)
+    for unit in units:
+        if len(unit) > 1:
+            for item in unit:
+                item.add_marker(pytest.mark.xdist_group(unit[0].nodeid))
+
+    if config.random_order_seed is not None:
+        units = scheduler.shuffle(units, config.random_order_seed)
+    elif config.getoption("--longest-first"):
+        units = scheduler.longest_first(units, durations)
+
+    if config.shard:
+        index, count = config.shard
+        selected = scheduler.shard(units, durations, count)[index]
+        keep = {id(item) for unit in selected for item in unit}
+        deselected = [item for item in items if id(item) not in keep]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        units = selected
+
+    items[:] = [item for unit in units for item in unit]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    with timing.in_test(item.nodeid):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # user_properties копіюються у звіт при його створенні, тож метрики додаються до yield, а шлях
+    # до артефактів збою -- вже у сам звіт (report.user_properties);
+    # так вони потрапляють і в junitxml, і до контролера xdist.
+    if call.when == "call" and browser_metrics.ENABLED:
+        records = browser_metrics.for_test(item.nodeid)
+        if records:
+            item.user_properties.append(("browser_metrics", records))
+    outcome = yield
+    report = outcome.get_result()
+    if not report.failed or call.when == "teardown":
+        return
+    funcargs = getattr(item, "funcargs", {})
+    drv = funcargs.get("driver") or funcargs.get("browser")
+    if drv is not None:
+        path = artifacts.capture(drv, item.nodeid, item.config.getoption("--artifacts-dir"))
+        report.sections.append(("artifacts", path))
+        report.user_properties.append(("artifacts", path))
+
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        # Воркер xdist: записи передаються контролеру, а той пише файл і підсумок.
+        workeroutput["step_timings"] = timing.RECORDS
+        workeroutput["calibration"] = calibration.RESULT
+        return
+    if calibration.RESULT is not None:
+        session.config.calibrations.append(calibration.RESULT)
+    path = session.config.getoption("--step-timings")
+    if path and timing.RECORDS:
+        timing.dump(path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    workeroutput = getattr(node, "workeroutput", {})
+    timing.RECORDS.extend(workeroutput.get("step_timings", []))
+    if workeroutput.get("calibration"):
+        node.config.calibrations.append(workeroutput["calibration"])
+
+
+def _browser_metrics_summary(tr, limit):
+    # user_properties має і звіт teardown, тож беруться лише звіти фази call.
+    records = [r for reports in tr.stats.values() for rep in reports if getattr(rep, "when", None) == "call"
+               for name, value in rep.user_properties if name == "browser_metrics"
+               for r in value]
+    if not records:
+        return
+    tr.write_sep("=", "метрики браузера за діями")
+    actions = sorted(browser_metrics.by_action(records).items(), key=lambda kv: kv[1]["task_ms"], reverse=True)
+    for action, t in actions[:limit]:
+        tr.write_line(f"{t['task_ms']:9.1f}ms task  {t['script_ms']:9.1f}ms script  {t['layouts']:6.0f} layout  "
+                      f"{t['style_recalcs']:6.0f} recalc  {t['long_tasks']:4.0f} long  {t['count']:5.0f}x  {action}")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    limit = config.getoption("--slowest-steps")
+    if not limit:
+        return
+    tr = terminalreporter
+    _browser_metrics_summary(tr, limit)
+    for c in config.calibrations:
+        tr.write_line(f"калібрування: load {c['load_ms']:.0f}ms, render {c['render_ms']:.0f}ms, "
+                      f"roundtrip {c['roundtrip_ms']:.1f}ms -> тайм-аути x{c['scale']:.2f}")
+    if not timing.RECORDS:
+        return
+    tr.write_sep("=", f"{limit} найповільніших кроків")
+    steps = sorted(timing.by_step().items(), key=lambda kv: kv[1]["total"], reverse=True)[:limit]
+    for name, s in steps:
+        tr.write_line(f"{s['total']:8.3f}s  {s['count']:5d}x  max {s['max']:6.3f}s  {s['kind']:<13} {name}")
+    kinds = timing.by_kind()
+    tr.write_line(
+        f"порожні пошуки: {kinds.get('empty_lookup', 0):.3f}s, "
+        f"time.sleep: {kinds.get('sleep', 0):.3f}s, "
+        f"явні очікування: {kinds.get('wait', 0):.3f}s"
+    )
+
+    close = sorted(((name, s) for name, s in timing.by_step().items() if s["max_used"] is not None),
+                   key=lambda kv: kv[1]["max_used"], reverse=True)[:limit]
+    if close:
+        tr.write_sep("-", "очікування, найближчі до тайм-ауту")
+        for name, s in close:
+            tr.write_line(f"{s['max_used']:6.0%} тайм-ауту  max {s['max']:6.3f}s  {s['count']:5d}x  {name}")
+
+
+@pytest.fixture(scope="session")
+def library_session(request):
+    # Те саме ядро, що й у tests_unittest.py. Під pytest-xdist кожен воркер піднімає власний
+    # сервер, а отже має окремий origin і сховище даних, і власний браузер.
+    option = request.config.getoption
+    session = LibrarySession(option("--app-url"), option("--app-dir"), sweep=option("--sweep")).start()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def url(library_session):
+    return library_session.url
+
+
+@pytest.fixture(scope="session")
+def browser(library_session):
+    # Браузер повертається в пул; дані, створені тестами, прибираються і браузер закривається в session.close().
+    drv = library_session.acquire()
+    yield drv
+    library_session.release(drv)
+
+
+@pytest.fixture(scope="class", autouse=True)
+def unittest_session(request):
+    # TestCase з tests_unittest.py під pytest працюють з тим самим сервером і браузером,
+    # що й tests.py, а не піднімають власну сесію з параметрами лише з оточення.
+    cls = request.cls
+    if cls is None or not issubclass(cls, unittest.TestCase) or not hasattr(cls, "session"):
+        yield
+        return
+    cls.session = request.getfixturevalue("library_session")
+    cls.browser = request.getfixturevalue("browser")
+    cls.artifacts_dir = request.config.getoption("--artifacts-dir")
+    yield
+    cls.session = cls.browser = cls.artifacts_dir = None
+
+
+@pytest.fixture
+def driver(browser):
+    # Стан між тестами скидає helper.open_app на початку кожного тесту, без перезавантаження сторінки.
+    return browser
+
+
+@pytest.fixture
+def seeded_books(driver):
+    """Фабрика: seeded_books(n=3, prefix="Book", year=2000, author=None) -> список назв, створених одним викликом."""
+    def _seed(n=1, prefix="Book", year=2000, author=None):
+        books = [{"title": unique_name(prefix), "year": year, "author": author} for _ in range(n)]
+        seed_books(driver, books)
+        return [b["title"] for b in books]
+    return _seed
@@ -0,0 +1,111 @@
+import atexit
+import functools
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from timing import instrument
+
+CACHE_FILE = Path(os.environ.get("CHROMEDRIVER_CACHE", Path.home() / ".cache" / "library-tests" / "chromedriver.json"))
+CACHE_TTL = 7 * 24 * 3600
+WINDOW_SIZE = "1920,1080"
+
+CHROME_ARGS = [
+    "--headless=new",
+    f"--window-size={WINDOW_SIZE}",
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--password-store=basic",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def chromedriver_path():
+    """
+    Шлях до chromedriver без звернення до мережі, якщо це можливо.
+
+    Порядок: змінна CHROMEDRIVER, потім кеш CACHE_FILE (не старший за CACHE_TTL і
+    лише якщо файл драйвера існує), і тільки тоді ChromeDriverManager().install().
+    """
+    explicit = os.environ.get("CHROMEDRIVER")
+    if explicit:
+        return explicit
+    try:
+        cached = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        if time.time() - cached["resolved_at"] < CACHE_TTL and os.path.exists(cached["path"]):
+            return cached["path"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    path = ChromeDriverManager().install()
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"path": path, "resolved_at": time.time()}), encoding="utf-8")
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
+    return path
+
+
+def _profile_copy(template):
+    # Chrome блокує каталог профілю, тож кожен браузер (і кожен воркер xdist) працює з власною копією.
+    target = tempfile.mkdtemp(prefix="library-profile-")
+    shutil.copytree(template, target, dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("Singleton*", "*.lock", "lockfile"))
+    atexit.register(shutil.rmtree, target, True)
+    return target
+
+
+def chrome_options(profile=None):
+    opts = Options()
+    for arg in CHROME_ARGS:
+        opts.add_argument(arg)
+    # Консоль сторінки зчитується лише при збої тесту (artifacts.capture).
+    opts.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    profile = profile or os.environ.get("LIBRARY_CHROME_PROFILE")
+    if profile:
+        opts.add_argument(f"--user-data-dir={_profile_copy(profile)}")
+    return opts
+
+
+def new_driver(profile=None):
+    """
+    Headless Chrome для тестів.
+
+    profile -- прогрітий каталог профілю (або LIBRARY_CHROME_PROFILE), з якого
+    береться копія: кеш HTTP, скомпільований JS і т.п. переживають перезапуск.
+
+    Якщо закешований chromedriver не підходить до Chrome (браузер оновився), кеш
+    скидається і драйвер визначається заново -- один раз.
+    """
+    options = chrome_options(profile)
+    try:
+        drv = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+    except SessionNotCreatedException:
+        if os.environ.get("CHROMEDRIVER"):
+            raise
+        try:
+            CACHE_FILE.unlink()
+        except OSError:
+            pass
+        chromedriver_path.cache_clear()
+        drv = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+    return instrument(drv)
@@ -1,51 +1,202 @@
-import time
+import itertools
+import os
+import uuid
+import weakref
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import registry
+from browser_metrics import measured
+from pages import MENU_ITEM_JS, SEARCH_JS, library_page
+from timing import timed
+from waits import MODAL_TIMEOUT, wait, wait_table_settled, mark_table, table_rows
 
+# Після кожного завантаження сторінки: позначка, що змінює клік по #tableHeader (сортування),
+# і знімок localStorage/sessionStorage -- open_app бере перший знімок як стартовий стан даних.
+_WATCH_JS = """
+if (!window.__libraryWatch) {
+    const watch = window.__libraryWatch = {sorted: false};
+    document.addEventListener('click', e => {
+        if (e.target instanceof Element && e.target.closest('#tableHeader')) watch.sorted = true;
+    }, true);
+}
+return {local: {...localStorage}, session: {...sessionStorage}};
+"""
 
+# Повертає сторінку до стартового стану. Дані і сортування на місці не скинути: якщо сховище
+# відрізняється від знімка (arguments[0]) або таблицю сортували, знімок повертається у сховище,
+# а open_app перезавантажує сторінку (reload). Інакше -- без перезавантаження: закриває
+# модальні вікна і меню, очищає пошук, перемикає на вкладку "Книги". Якщо застосунок має
+# хук window.__libraryTestReset, він викликається першим.
+_RESET_JS = SEARCH_JS + MENU_ITEM_JS + """
+const snapshot = arguments[0];
+if (typeof window.__libraryTestReset === 'function') window.__libraryTestReset();
+const same = (store, saved) => store.length === Object.keys(saved).length
+    && Object.entries(saved).every(([k, v]) => store.getItem(k) === v);
+const restore = (store, saved) => {
+    store.clear();
+    for (const [k, v] of Object.entries(saved)) store.setItem(k, v);
+};
+const watch = window.__libraryWatch;
+const dataChanged = !!snapshot && !(same(localStorage, snapshot.local) && same(sessionStorage, snapshot.session));
+if (!watch || watch.sorted || dataChanged) {
+    if (snapshot) {
+        restore(localStorage, snapshot.local);
+        restore(sessionStorage, snapshot.session);
+    }
+    return {clean: false, changed: false, reload: true};
+}
+const visible = el => !!el && el.checkVisibility({opacityProperty: true, visibilityProperty: true});
+const modals = ['authorModal', 'bookModal'].map(id => document.getElementById(id));
+const dropdown = document.getElementById('dropdown');
+const header = document.getElementById('tableHeader');
+const inp = document.getElementById('mainInput');
+if (!dropdown || !header || !inp) return {clean: false, changed: false};
+let changed = false;
+for (const m of modals.filter(visible)) {
+    const close = m.querySelector('.close, .close-btn, .cancel-btn, [data-close], [data-dismiss]');
+    if (!close) return {clean: false, changed};
+    close.click();
+    changed = true;
+}
+if (dropdown.classList.contains('active')) document.querySelector('.menu-btn').click();
+if (inp.value) {
+    setSearch(inp, '');
+    changed = true;
+}
+if (header.textContent.includes('Email')) {
+    const books = menuItem('Книги');
+    if (!books) return {clean: false, changed};
+    books.click();
+    changed = true;
+}
+const clean = !modals.some(visible) && !dropdown.classList.contains('active')
+    && !inp.value && !header.textContent.includes('Email');
+return {clean, changed};
+"""
 
+_snapshots = weakref.WeakKeyDictionary()
+
+_RUN_ID = uuid.uuid4().hex[:6]
+_counter = itertools.count()
+
+
+def unique_name(prefix):
+    """
+    Унікальне ім'я в межах прогону, воркера xdist і процесу: Prefix_uitest7q_gw1_3fa9c2_000007.
+
+    registry.TEST_MARKER позначає ім'я як тестове для registry.sweep.
+
+    Лічильник фіксованої ширини, тож жодне ім'я не є підрядком іншого з тим самим
+    префіксом (інакше пошук і registry.cleanup знаходили б і ..._10, шукаючи ..._1).
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return f"{prefix}_{registry.TEST_MARKER}_{worker}_{_RUN_ID}_{next(_counter):06d}"
+
+
+@measured
+@timed
+def open_app(drv, url):
+    """
+    Відкриває застосунок у стартовому стані: дані як після першого завантаження в цьому
+    браузері (знімок localStorage/sessionStorage), сортування за замовчуванням, вкладка "Книги",
+    порожній пошук, без модальних вікон.
+
+    Якщо браузер уже на url, а дані й сортування не змінювались, стан скидається на місці
+    одним execute_script. Повна навігація drv.get(url) -- коли тест змінив дані чи сортування
+    (сховище спершу повертається до знімка), коли скинути не вдалося або сторінка інша.
+    """
+    if drv.current_url.split("#")[0] == url:
+        try:
+            state = drv.execute_script(_RESET_JS, _snapshots.get(drv))
+        except WebDriverException:
+            state = None
+            try:
+                drv.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+        if state and state["clean"]:
+            if state["changed"]:
+                wait_table_settled(drv)
+            return
+    drv.get(url)
+    storage = drv.execute_script(_WATCH_JS)
+    _snapshots.setdefault(drv, storage)
+
+
+@measured
+@timed
 def click_menu(drv, text):
-    menu_btn = drv.find_element(By.CLASS_NAME, "menu-btn")
-    menu_btn.click()
-    WebDriverWait(drv, 2).until(lambda d: "active" in drv.find_element(By.ID, "dropdown").get_attribute("class"))
+    library_page(drv).click_menu(text)
+
+
+@measured
+@timed
+def search(drv, text):
+    library_page(drv).search(text)
 
-    xpath = f"//div[contains(@class,'dropdown-item') and contains(., '{text}')]"
-    item = WebDriverWait(drv, 2).until(EC.element_to_be_clickable((By.XPATH, xpath)))
-    item.click()
 
+@measured
+@timed
+def sort_by(drv, header_text):
+    library_page(drv).sort_by(header_text)
 
+
+@measured
+@timed
 def add_author_helper(drv, first, last, email):
-    click_menu(drv, "Додати автора")
-    WebDriverWait(drv, 3).until(EC.visibility_of_element_located((By.ID, "authorModal")))
-    time.sleep(0.3)
+    registry.track(drv, "author", first)
+    modal = library_page(drv).author_modal
+    modal.open()
 
-    drv.find_element(By.ID, "authFirstName").send_keys(first)
-    drv.find_element(By.ID, "authLastName").send_keys(last)
-    drv.find_element(By.ID, "authAge").send_keys("30")
-    drv.find_element(By.ID, "authEmail").send_keys(email)
+    modal.fill(first_name=first, last_name=last, age=30, email=email)
 
-    drv.find_element(By.CSS_SELECTOR, "#authorModal .save-btn").click()
-    WebDriverWait(drv, 3).until(EC.invisibility_of_element_located((By.ID, "authorModal")))
-    time.sleep(0.5)
+    modal.save()
 
 
+@measured
+@timed
 def add_book_helper(drv, title, year):
-    click_menu(drv, "Додати книгу")
-    WebDriverWait(drv, 3).until(EC.visibility_of_element_located((By.ID, "bookModal")))
-    time.sleep(0.3)
-
-    drv.find_element(By.ID, "bookTitle").send_keys(title)
-    drv.find_element(By.ID, "bookYear").send_keys(str(year))
-
-    try:
-        select = drv.find_element(By.ID, "bookAuthorSelect")
-        options = select.find_elements(By.TAG_NAME, "option")
-        if options:
-            options[0].click()
-    except:
-        pass
-
-    drv.find_element(By.CSS_SELECTOR, "#bookModal .save-btn").click()
-    WebDriverWait(drv, 3).until(EC.invisibility_of_element_located((By.ID, "bookModal")))
-    time.sleep(0.5)
+    registry.track(drv, "book", title)
+    modal = library_page(drv).book_modal
+    modal.open()
+
+    # author=None -- перша опція bookAuthorSelect, якщо список є.
+    modal.fill(title=title, year=year, author=None)
+
+    modal.save()
+
+
+def _book_row(drv, title):
+    search(drv, title)
+    rows = table_rows(drv)
+    if not rows:
+        raise LookupError(f"Книга {title!r} не знайдена")
+    return rows[0]
+
+
+@measured
+@timed
+def edit_book_helper(drv, old_title, new_title):
+    """Знаходить книгу пошуком і перейменовує її через кнопку .edit-btn."""
+    registry.track(drv, "book", new_title)
+    _book_row(drv, old_title).find_element(By.CLASS_NAME, "edit-btn").click()
+    modal = library_page(drv).book_modal
+    modal.wait_open()
+
+    modal.fill(title=new_title)
+
+    modal.save()
+    registry.forget(drv, "book", old_title)
+
+
+@measured
+@timed
+def delete_book_helper(drv, title):
+    """Знаходить книгу пошуком і видаляє її кнопкою .del-btn з підтвердженням."""
+    row = _book_row(drv, title)
+    mark_table(drv)
+    row.find_element(By.CLASS_NAME, "del-btn").click()
+    wait(drv, MODAL_TIMEOUT).until(EC.alert_is_present()).accept()
+    wait_table_settled(drv, marked=True)
+    registry.forget(drv, "book", title)
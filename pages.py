@@ -0,0 +1,257 @@
+import weakref
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from waits import (MENU_TIMEOUT, wait, wait_dropdown_open, wait_modal_open, wait_modal_closed, wait_table_settled,
+                   mark_table, find)
+
+_MENU_JS = "return [...document.querySelectorAll('.dropdown-item')].map(e => [e.textContent.trim(), e]);"
+
+# Пункт меню за текстом у скриптах сторінки -- як LibraryPage.menu_item: спершу точний збіг, потім частковий.
+MENU_ITEM_JS = """
+const menuItem = text => {
+    const items = [...document.querySelectorAll('.dropdown-item')];
+    return items.find(e => e.textContent.trim() === text) || items.find(e => e.textContent.includes(text));
+};
+"""
+
+# Встановлює значення поля так, як це зробив би користувач: через нативний сеттер value
+# (щоб його побачили й фреймворки) з подіями input і change. Для <select> значення -- це
+# value опції або частина її тексту; null -- перша опція.
+SET_VALUE_JS = """
+const setValue = (el, v) => {
+    if (el.tagName === 'SELECT') {
+        const opts = [...el.options];
+        const opt = v === null ? opts[0]
+            : opts.find(o => o.value === String(v)) || opts.find(o => o.text.includes(v));
+        if (!opt) {
+            if (v === null) return;
+            throw new Error(`#${el.id}: no option "${v}"`);
+        }
+        el.value = opt.value;
+    } else {
+        const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, String(v));
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+};
+"""
+
+# Рядок пошуку: застосунок фільтрує таблицю за keyup, тому після setValue ще й keyup.
+SEARCH_JS = SET_VALUE_JS + """
+const setSearch = (inp, text) => {
+    setValue(inp, text);
+    inp.dispatchEvent(new Event('keyup', {bubbles: true}));
+};
+"""
+
+_CLEAR_SEARCH_JS = SEARCH_JS + "setSearch(arguments[0], '');"
+
+_FILL_JS = SET_VALUE_JS + """
+try {
+    for (const [id, v] of Object.entries(arguments[0])) {
+        const el = document.getElementById(id);
+        if (!el) {
+            if (v === null) continue;
+            return `#${id} not found`;
+        }
+        setValue(el, v);
+    }
+} catch (e) {
+    return String(e);
+}
+return null;
+"""
+
+
+class CachedElement:
+    """
+    Елемент, знайдений один раз і перевикористаний, доки DOM його не замінить.
+
+    Звертання делегуються WebElement; якщо той застарів (StaleElementReferenceException),
+    елемент шукається знову і дія повторюється один раз. Застарілий елемент сервер
+    відхиляє до виконання дії, тож повтор безпечний і для click().
+    """
+
+    def __init__(self, drv, by, value):
+        self._drv = drv
+        self._locator = (by, value)
+        self._el = None
+
+    @property
+    def element(self):
+        if self._el is None:
+            self._el = find(self._drv, *self._locator)
+        return self._el
+
+    def __getattr__(self, name):
+        try:
+            attr = getattr(self.element, name)
+        except StaleElementReferenceException:
+            self._el = None
+            attr = getattr(self.element, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            try:
+                return attr(*args, **kwargs)
+            except StaleElementReferenceException:
+                self._el = None
+                return getattr(self.element, name)(*args, **kwargs)
+        return call
+
+
+class Locator:
+    """Дескриптор сторінки: повертає CachedElement, спільний для всіх звертань до цього екземпляра."""
+
+    def __init__(self, by, value, tag=None):
+        self.by = by
+        self.value = value
+        self.tag = tag
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner):
+        if page is None:
+            return self
+        cached = page._elements.get(self.name)
+        if cached is None:
+            cached = page._elements[self.name] = CachedElement(page.drv, self.by, self.value)
+        return cached
+
+
+class _Page:
+    def __init__(self, drv):
+        self.drv = drv
+        self._elements = {}
+
+
+class _Modal(_Page):
+    modal_id = None
+    menu_text = None
+    save_button = None
+
+    def __init__(self, drv, library):
+        super().__init__(drv)
+        self.library = library
+
+    def open(self):
+        self.library.click_menu(self.menu_text)
+        self.wait_open()
+
+    def wait_open(self):
+        wait_modal_open(self.drv, self.modal_id)
+
+    def fill(self, typing=False, **fields):
+        """
+        Заповнює поля вікна: ключі -- імена локаторів (title=..., year=..., author=...).
+
+        За замовчуванням усі значення встановлюються одним execute_script з подіями
+        input/change. typing=True набирає текстові поля через send_keys -- для тестів,
+        що перевіряють саме обробку введення; <select> і тоді вибирається за value.
+        """
+        values = {}
+        for name, value in fields.items():
+            locator = getattr(type(self), name)
+            if typing and locator.tag != "select":
+                field = getattr(self, name)
+                field.clear()
+                field.send_keys(str(value))
+            else:
+                values[locator.value] = value
+        if values:
+            error = self.drv.execute_script(_FILL_JS, values)
+            if error:
+                raise ValueError(f"#{self.modal_id}: {error}")
+
+    def save(self):
+        mark_table(self.drv)
+        self.save_button.click()
+        wait_modal_closed(self.drv, self.modal_id)
+        wait_table_settled(self.drv, marked=True)
+
+
+class AuthorModal(_Modal):
+    modal_id = "authorModal"
+    menu_text = "Додати автора"
+    first_name = Locator(By.ID, "authFirstName")
+    last_name = Locator(By.ID, "authLastName")
+    age = Locator(By.ID, "authAge")
+    email = Locator(By.ID, "authEmail")
+    save_button = Locator(By.CSS_SELECTOR, "#authorModal .save-btn")
+
+
+class BookModal(_Modal):
+    modal_id = "bookModal"
+    menu_text = "Додати книгу"
+    title = Locator(By.ID, "bookTitle")
+    year = Locator(By.ID, "bookYear")
+    author = Locator(By.ID, "bookAuthorSelect", tag="select")
+    save_button = Locator(By.CSS_SELECTOR, "#bookModal .save-btn")
+
+
+class LibraryPage(_Page):
+    heading = Locator(By.TAG_NAME, "h1")
+    menu_btn = Locator(By.CLASS_NAME, "menu-btn")
+    main_input = Locator(By.ID, "mainInput")
+    table_header = Locator(By.ID, "tableHeader")
+    table_body = Locator(By.ID, "tableBody")
+
+    def __init__(self, drv):
+        super().__init__(drv)
+        self._menu = None
+        self.author_modal = AuthorModal(drv, self)
+        self.book_modal = BookModal(drv, self)
+
+    def menu_item(self, text):
+        """Пункт меню з мапи текст -> елемент, побудованої одним execute_script."""
+        if self._menu is None:
+            self._menu = dict(self.drv.execute_script(_MENU_JS))
+        if text in self._menu:
+            return self._menu[text]
+        item = next((el for label, el in self._menu.items() if text in label), None)
+        if item is None:
+            # Мапа могла застаріти: наступний виклик збудує її заново.
+            labels = list(self._menu)
+            self._menu = None
+            raise NoSuchElementException(f"Пункт меню {text!r} не знайдено серед {labels}")
+        return item
+
+    def click_menu(self, text):
+        self.menu_btn.click()
+        wait_dropdown_open(self.drv)
+        try:
+            item = wait(self.drv, MENU_TIMEOUT).until(EC.element_to_be_clickable(self.menu_item(text)))
+        except StaleElementReferenceException:
+            self._menu = None
+            item = wait(self.drv, MENU_TIMEOUT).until(EC.element_to_be_clickable(self.menu_item(text)))
+        item.click()
+
+    def search(self, text):
+        mark_table(self.drv)
+        if text:
+            self.main_input.clear()
+            self.main_input.send_keys(text)
+        else:
+            # clear() і send_keys("") не дають жодної події клавіатури, і фільтр лишився б.
+            self.drv.execute_script(_CLEAR_SEARCH_JS, self.main_input)
+        wait_table_settled(self.drv, marked=True)
+
+    def sort_by(self, header_text):
+        mark_table(self.drv)
+        find(self.drv, By.XPATH, f"//th[contains(., '{header_text}')]").click()
+        wait_table_settled(self.drv, marked=True)
+
+
+_pages = weakref.WeakKeyDictionary()
+
+
+def library_page(drv):
+    """LibraryPage, закешована для драйвера: локатори переживають виклики хелперів і тести."""
+    page = _pages.get(drv)
+    if page is None:
+        page = _pages[drv] = LibraryPage(drv)
+    return page
@@ -0,0 +1,102 @@
+import queue
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from driver_factory import new_driver
+
+
+class DriverPool:
+    """
+    Пул браузерів у межах одного процесу.
+
+    Браузери створюються ліниво, не більше size штук; acquire() блокується,
+    поки всі зайняті. Стан сторінки скидає helper.open_app на початку тесту.
+    """
+
+    def __init__(self, size=1, factory=new_driver):
+        self.size = size
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._all = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            spawn = len(self._all) < self.size
+            if spawn:
+                self._all.append(None)
+        if not spawn:
+            return self._idle.get()
+        try:
+            drv = self._factory()
+        except BaseException:
+            # Інакше місце лишиться зайнятим і наступні acquire() чекатимуть вічно.
+            with self._lock:
+                self._all.remove(None)
+            raise
+        with self._lock:
+            self._all[self._all.index(None)] = drv
+        return drv
+
+    def release(self, drv):
+        self._idle.put(drv)
+
+    def close(self, before_quit=None):
+        """Закриває всі браузери; помилка before_quit чи quit одного не залишає інші відкритими."""
+        with self._lock:
+            drivers, self._all = self._all, []
+        errors = []
+        for drv in drivers:
+            if drv is None:
+                continue
+            for action in (before_quit, lambda d: d.quit()):
+                if action is None:
+                    continue
+                try:
+                    action(drv)
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            raise errors[0]
+
+
+class _LockedResult:
+    def __init__(self, result, lock):
+        self._result = result
+        self._lock = lock
+
+    def __getattr__(self, name):
+        attr = getattr(self._result, name)
+        if not callable(attr):
+            return attr
+
+        def _locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return _locked
+
+
+def _flatten(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _flatten(test)
+        else:
+            yield test
+
+
+class ParallelSuite(unittest.TestSuite):
+    """Запускає тести набору у workers потоках; кожен тест сам бере браузер з DriverPool."""
+
+    def __init__(self, tests=(), workers=1):
+        super().__init__(tests)
+        self.workers = workers
+
+    def run(self, result, debug=False):
+        locked = _LockedResult(result, threading.Lock())
+        with ThreadPoolExecutor(self.workers) as ex:
+            list(ex.map(lambda test: test(locked), _flatten(self)))
+        return result
@@ -0,0 +1,122 @@
+import threading
+from pages import MENU_ITEM_JS, SEARCH_JS
+from timing import timed
+
+# Мітка в кожному імені, яке створюють тести (helper.unique_name, bench.Catalogue).
+# --sweep видаляє лише рядки з "_<мітка>_", тож справжні записи спільного екземпляра не зачіпаються.
+TEST_MARKER = "uitest7q"
+
+CLEANUP_TIMEOUT = 600
+
+# Видаляє записи через кнопки .del-btn самої сторінки одним викликом: window.confirm
+# тимчасово підміняється, щоб не було діалогів. Спершу книги, потім автори.
+# targets -- [{kind: 'book'|'author', text}]; рядок видаляється, якщо якась клітинка містить text.
+_DELETE_JS = SEARCH_JS + MENU_ITEM_JS + """
+const [targets, quiet] = arguments;
+const done = arguments[arguments.length - 1];
+const body = () => document.getElementById('tableBody');
+const inp = document.getElementById('mainInput');
+const settle = () => new Promise(ok => {
+    let last = performance.now();
+    const observer = new MutationObserver(() => { last = performance.now(); });
+    observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    (function tick() {
+        if (performance.now() - last >= quiet) { observer.disconnect(); ok(); }
+        else setTimeout(tick, 10);
+    })();
+});
+const search = async text => {
+    setSearch(inp, text);
+    await settle();
+};
+const matches = (row, t) => [...row.querySelectorAll('td')].some(td => td.textContent.includes(t.text));
+const originalConfirm = window.confirm;
+window.confirm = () => true;
+let deleted = 0;
+(async () => {
+    for (const [kind, view] of [['book', 'Книги'], ['author', 'Автори']]) {
+        const mine = targets.filter(t => t.kind === kind);
+        if (!mine.length) continue;
+        menuItem(view).click();
+        await settle();
+        for (const t of mine) {
+            await search(t.text);
+            // Не більше кліків, ніж було збігів: якщо застосунок відмовить у видаленні, цикл не зависне.
+            let budget = [...body().querySelectorAll('tr')].filter(r => matches(r, t)).length;
+            for (; budget > 0; budget--) {
+                const row = [...body().querySelectorAll('tr')].find(r => matches(r, t));
+                const btn = row && row.querySelector('.del-btn');
+                if (!btn) break;
+                btn.click();
+                deleted++;
+                await settle();
+            }
+        }
+    }
+    await search('');
+    menuItem('Книги').click();
+    await settle();
+})().then(() => done(deleted), e => done(String(e))).finally(() => { window.confirm = originalConfirm; });
+"""
+
+
+class Registry:
+    """Записи, створені тестами, окремо для кожного браузера (у кожного -- своє сховище даних)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def track(self, drv, kind, name):
+        with self._lock:
+            self._entries.setdefault(id(drv), {})[kind, name] = None
+
+    def forget(self, drv, kind, name):
+        with self._lock:
+            self._entries.get(id(drv), {}).pop((kind, name), None)
+
+    def drain(self, drv):
+        with self._lock:
+            return list(self._entries.pop(id(drv), {}))
+
+
+REGISTRY = Registry()
+
+
+def track(drv, kind, name):
+    """kind -- "book" (name -- назва) або "author" (name -- ім'я)."""
+    REGISTRY.track(drv, kind, name)
+
+
+def forget(drv, kind, name):
+    """Запис уже видалено самим тестом (наприклад, delete_book_helper) -- cleanup його не шукатиме."""
+    REGISTRY.forget(drv, kind, name)
+
+
+def _delete(drv, url, targets, quiet=0.05):
+    if not targets:
+        return 0
+    if drv.current_url.split("#")[0] != url:
+        drv.get(url)
+    # sweep іде до тестів у тому ж браузері: тайм-аут скриптів повертається до попереднього.
+    previous = drv.timeouts.script
+    drv.set_script_timeout(CLEANUP_TIMEOUT)
+    try:
+        result = drv.execute_async_script(_DELETE_JS, targets, int(quiet * 1000))
+    finally:
+        drv.set_script_timeout(previous)
+    if isinstance(result, str):
+        raise RuntimeError(f"Cleanup failed: {result}")
+    return result
+
+
+@timed
+def cleanup(drv, url):
+    """Видаляє все, що тести створили в цьому браузері, одним пакетом. Повертає кількість видалених рядків."""
+    return _delete(drv, url, [{"kind": kind, "text": name} for kind, name in REGISTRY.drain(drv)])
+
+
+@timed
+def sweep(drv, url, marker=TEST_MARKER):
+    """Прибирає залишки попередніх (зокрема аварійно перерваних) прогонів за префіксами імен."""
+    return _delete(drv, url, [{"kind": kind, "text": f"_{marker}_"} for kind in ("book", "author")])
@@ -0,0 +1,58 @@
+"""
+Сценарії, спільні для tests.py і tests_unittest.py: тіло кожного -- тут, раннери лише
+дають drv і url. Перевірки -- звичайні assert, тож AssertionError є провалом в обох.
+
+LIBRARY_SCENARIO_RUNNER вибирає, хто їх виконує: "pytest", "unittest" або "all"
+(за замовчуванням). У CI, де запускаються обидва набори, досить однієї назви,
+і кожен сценарій пройде лише раз.
+"""
+import os
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from helper import unique_name, open_app, click_menu, add_author_helper
+from pages import library_page
+from table import table_snapshot
+from waits import HEADER_TIMEOUT, wait
+
+RUNNER = os.environ.get("LIBRARY_SCENARIO_RUNNER", "all")
+if RUNNER not in ("pytest", "unittest", "all"):
+    raise ValueError(f"LIBRARY_SCENARIO_RUNNER={RUNNER!r}: expected pytest, unittest or all")
+
+
+def runs_in(runner):
+    return RUNNER in (runner, "all")
+
+
+def skip_reason(runner):
+    return f"спільні сценарії виконує {RUNNER} (LIBRARY_SCENARIO_RUNNER), не {runner}"
+
+
+def page_loads(drv, url):
+    """1. Сторінка відкривається, основні елементи інтерфейсу доступні."""
+    open_app(drv, url)
+    assert "Библиотека" in drv.title
+    page = library_page(drv)
+    assert page.heading.is_displayed()
+    assert page.main_input.is_displayed()
+    assert page.menu_btn.is_displayed()
+
+
+def switch_to_authors(drv, url):
+    """2. Перемикання на авторів змінює заголовок таблиці."""
+    open_app(drv, url)
+    click_menu(drv, "Автори")
+    wait(drv, HEADER_TIMEOUT).until(EC.presence_of_element_located((By.XPATH, "//th[contains(., 'Email')]")))
+    headers = table_snapshot(drv).header_text
+    assert "Email" in headers
+
+
+def add_author(drv, url):
+    """3. Додавання автора."""
+    open_app(drv, url)
+    click_menu(drv, "Автори")
+
+    author_name = unique_name("TestAuth")
+    add_author_helper(drv, author_name, "User", f"{author_name}@test.com")
+
+    page_source = table_snapshot(drv).text
+    assert author_name in page_source
@@ -0,0 +1,97 @@
+import heapq
+import json
+import random
+
+DEFAULT_COST = 1.0
+
+
+def load_durations(path):
+    """{nodeid: секунди} з файлу --step-timings (JSON); порожній dict, якщо файлу немає."""
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)["records"]
+    except (OSError, ValueError, KeyError):
+        return {}
+    durations = {}
+    for r in records:
+        if r["kind"] == "test":
+            durations[r["test"]] = r["seconds"]
+    return durations
+
+
+def resources(item):
+    """Спільні дані, які тест оголосив через @pytest.mark.library(data=(...))."""
+    marker = item.get_closest_marker("library")
+    return set(marker.kwargs.get("data", ())) if marker else set()
+
+
+def units(items):
+    """
+    Розбиває тести на неподільні групи: тести зі спільним ресурсом даних потрапляють
+    в одну групу (транзитивно) і зберігають відносний порядок збору.
+    """
+    parent = list(range(len(items)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owner = {}
+    for i, item in enumerate(items):
+        for name in resources(item):
+            if name in owner:
+                parent[root(i)] = root(owner[name])
+            else:
+                owner[name] = i
+
+    groups = {}
+    for i, item in enumerate(items):
+        groups.setdefault(root(i), []).append(item)
+    return list(groups.values())
+
+
+def cost(unit, durations):
+    known = [durations[item.nodeid] for item in unit if item.nodeid in durations]
+    default = sum(durations.values()) / len(durations) if durations else DEFAULT_COST
+    return sum(known) + default * (len(unit) - len(known))
+
+
+def longest_first(unit_list, durations):
+    return sorted(unit_list, key=lambda unit: cost(unit, durations), reverse=True)
+
+
+def shard(unit_list, durations, count):
+    """
+    Жадібний LPT: найдорожча група -- у найменш завантажений шард.
+    Повертає count списків груп; порядок груп у шарді -- як у unit_list.
+    """
+    order = {id(unit): i for i, unit in enumerate(unit_list)}
+    heap = [(0.0, index) for index in range(count)]
+    shards = [[] for _ in range(count)]
+    for unit in longest_first(unit_list, durations):
+        load, index = heapq.heappop(heap)
+        shards[index].append(unit)
+        heapq.heappush(heap, (load + cost(unit, durations), index))
+    return [sorted(s, key=lambda unit: order[id(unit)]) for s in shards]
+
+
+def shuffle(unit_list, seed):
+    """Випадковий порядок груп і тестів у групах -- для пошуку прихованих залежностей від порядку."""
+    rnd = random.Random(seed)
+    shuffled = [list(unit) for unit in unit_list]
+    for unit in shuffled:
+        rnd.shuffle(unit)
+    rnd.shuffle(shuffled)
+    return shuffled
+
+
+def parse_shard(value):
+    """'2/4' -> (1, 4): нульовий індекс шарда і кількість шардів."""
+    index, count = (int(part) for part in value.split("/"))
+    if not 1 <= index <= count:
+        raise ValueError(f"shard {value}: expected K/N with 1 <= K <= N")
+    return index - 1, count
@@ -0,0 +1,89 @@
+import registry
+from browser_metrics import measured
+from pages import MENU_ITEM_JS, SET_VALUE_JS
+from timing import timed
+from waits import MODAL_TIMEOUT, budget
+
+# Один виклик execute_async_script на всю пачку: для кожного запису відкриває модальне
+# вікно через пункт меню, заповнює поля (setValue з pages.SET_VALUE_JS), зберігає і чекає закриття.
+_SEED_JS = SET_VALUE_JS + MENU_ITEM_JS + """
+const [menu, modalId, records, stepTimeout] = arguments;
+const done = arguments[arguments.length - 1];
+const item = menuItem(menu);
+const modal = document.getElementById(modalId);
+if (!item || !modal) { done(`menu item "${menu}" or #${modalId} not found`); return; }
+
+const visible = () => modal.checkVisibility({opacityProperty: true, visibilityProperty: true});
+const until = (cond, what) => new Promise((ok, fail) => {
+    const t0 = performance.now();
+    (function poll() {
+        if (cond()) ok();
+        else if (performance.now() - t0 > stepTimeout) fail(new Error(`timeout: ${what}`));
+        else requestAnimationFrame(poll);
+    })();
+});
+(async () => {
+    for (const rec of records) {
+        item.click();
+        await until(visible, `#${modalId} open`);
+        for (const [id, v] of Object.entries(rec)) setValue(document.getElementById(id), v);
+        modal.querySelector('.save-btn').click();
+        await until(() => !visible(), `#${modalId} closed`);
+    }
+    await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+})().then(() => done(null), e => done(String(e)));
+"""
+
+
+def _seed(drv, menu, modal_id, records):
+    step = budget(MODAL_TIMEOUT)
+    # На кожен запис -- до двох кроків (відкриття і закриття вікна); тайм-аут скриптів
+    # драйвера (30 с за замовчуванням) обірвав би велику пачку раніше за них.
+    previous = drv.timeouts.script
+    drv.set_script_timeout(max(previous, (2 * len(records) + 1) * step))
+    try:
+        error = drv.execute_async_script(_SEED_JS, menu, modal_id, records, step * 1000)
+    finally:
+        drv.set_script_timeout(previous)
+    if error:
+        raise RuntimeError(f"Seeding via #{modal_id} failed: {error}")
+
+
+@measured
+@timed
+def seed_authors(drv, authors, tracked=True):
+    """
+    authors -- dict-и з ключами first, last, email і необов'язковим age (за замовчуванням 30).
+
+    tracked=False -- не реєструвати записи для registry.cleanup (наприклад, великі каталоги bench.py).
+    """
+    authors = list(authors)
+    if tracked:
+        for a in authors:
+            registry.track(drv, "author", a["first"])
+    _seed(drv, "Додати автора", "authorModal", [
+        {"authFirstName": a["first"], "authLastName": a["last"],
+         "authAge": a.get("age", 30), "authEmail": a["email"]}
+        for a in authors
+    ])
+
+
+@measured
+@timed
+def seed_books(drv, books, tracked=True):
+    """
+    books -- dict-и з ключами title, year і необов'язковим author.
+
+    author -- value опції bookAuthorSelect або частина її тексту (наприклад, ім'я автора);
+    без нього лишається вибір за замовчуванням, як у add_book_helper.
+    tracked -- як у seed_authors.
+    """
+    records = []
+    for b in books:
+        if tracked:
+            registry.track(drv, "book", b["title"])
+        fields = {"bookTitle": b["title"], "bookYear": b["year"]}
+        if b.get("author") is not None:
+            fields["bookAuthorSelect"] = b["author"]
+        records.append(fields)
+    _seed(drv, "Додати книгу", "bookModal", records)
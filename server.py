@@ -0,0 +1,64 @@
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_URL = "http://localhost:8001/index.html"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class LibraryServer:
+    """
+    Локальний HTTP-сервер для сторінки бібліотеки та її файлів з даними.
+
+    Порт вибирається системою (port=0), сокет відкривається вже в конструкторі,
+    тож сервер готовий одразу після start(). Кожен екземпляр -- окремий origin,
+    а отже й окреме сховище браузера для даних застосунку.
+    """
+
+    def __init__(self, root, host="127.0.0.1", port=0, page="index.html"):
+        handler = functools.partial(_QuietHandler, directory=os.fspath(root))
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self.page = page
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/{self.page}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def start_app(app_url=None, app_dir=None):
+    """
+    Повертає (url, server).
+
+    Пріоритет: явний app_url / LIBRARY_URL, потім локальний сервер для
+    app_dir / LIBRARY_APP_DIR, інакше -- зовнішній застосунок на DEFAULT_URL.
+    server дорівнює None, якщо локальний сервер не запускався.
+    """
+    app_url = app_url or os.environ.get("LIBRARY_URL")
+    app_dir = app_dir or os.environ.get("LIBRARY_APP_DIR")
+    if app_url:
+        return app_url, None
+    if app_dir:
+        server = LibraryServer(app_dir).start()
+        return server.url, server
+    return DEFAULT_URL, None
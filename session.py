@@ -0,0 +1,57 @@
+import calibration
+import registry
+from driver_factory import new_driver
+from pool import DriverPool
+from server import start_app
+
+
+class LibrarySession:
+    """
+    Спільне ядро обох наборів (conftest.py і tests_unittest.py): застосунок
+    (server.start_app), пул браузерів (DriverPool з driver_factory.new_driver) і
+    прибирання створених тестами даних (registry) перед закриттям браузерів.
+
+    sweep=True -- кожен новий браузер спершу прибирає залишки попередніх прогонів.
+    Перший браузер процесу калібрує тайм-аути очікувань (calibration.calibrate).
+    """
+
+    def __init__(self, app_url=None, app_dir=None, workers=1, sweep=False):
+        self.app_url = app_url
+        self.app_dir = app_dir
+        self.sweep = sweep
+        self.url = None
+        self._server = None
+        self.pool = DriverPool(size=workers, factory=self._new_driver)
+
+    @property
+    def workers(self):
+        return self.pool.size
+
+    def start(self):
+        self.url, self._server = start_app(self.app_url, self.app_dir)
+        return self
+
+    def _new_driver(self):
+        drv = new_driver()
+        try:
+            calibration.calibrate(drv, self.url)
+            if self.sweep:
+                registry.sweep(drv, self.url)
+        except Exception:
+            drv.quit()
+            raise
+        return drv
+
+    def acquire(self):
+        return self.pool.acquire()
+
+    def release(self, drv):
+        self.pool.release(drv)
+
+    def close(self):
+        try:
+            self.pool.close(before_quit=lambda drv: registry.cleanup(drv, self.url))
+        finally:
+            if self._server is not None:
+                self._server.stop()
+                self._server = None
@@ -0,0 +1,61 @@
+"""
+Soak-режим: pytest soak.py [--soak-cycles 5000] [--soak-sample-every 50].
+
+В одній сторінці без перезавантаження тисячі разів повторюється цикл "додати книгу ->
+перейменувати -> видалити" через звичайні хелпери. Після --soak-warmup циклів кожні
+--soak-sample-every циклів знімаються JS heap, кількість вузлів DOM і обробників подій
+(після примусового GC). Тест падає, якщо нахил прямої найменших квадратів для будь-якої
+з цих величин більший за допустимий -- так видно відірвані рядки #tableBody і обробники,
+які перемальовування таблиці не звільняє, хоча один прохід тестів їх не помічає.
+"""
+import pytest
+from browser_metrics import gauges
+from helper import unique_name, open_app, search, add_book_helper, edit_book_helper, delete_book_helper
+from stats import slope
+
+SAMPLES = []
+
+
+def _cycle(drv):
+    title = unique_name("Soak")
+    edited = unique_name("SoakEdited")
+    add_book_helper(drv, title, 2000)
+    edit_book_helper(drv, title, edited)
+    delete_book_helper(drv, edited)
+    # Не open_app: після зміни даних він перезавантажив би сторінку, а витік треба ловити в одній.
+    search(drv, "")
+
+
+@pytest.fixture(scope="module")
+def report(request):
+    yield
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None and SAMPLES:
+        reporter.write_sep("=", "soak: heap / DOM після GC")
+        for cycle, g in SAMPLES:
+            reporter.write_line(f"цикл {cycle:6d}  heap {g['heap_used'] / 1024:10.1f}KB  "
+                                f"вузлів {g['nodes']:7.0f}  обробників {g['listeners']:6.0f}")
+
+
+def test_book_cycle_does_not_leak(request, report, driver, url):
+    option = request.config.getoption
+    cycles, every, warmup = option("--soak-cycles"), option("--soak-sample-every"), option("--soak-warmup")
+    limits = {
+        "heap_used": option("--soak-max-heap-slope"),
+        "nodes": option("--soak-max-node-slope"),
+        "listeners": option("--soak-max-listener-slope"),
+    }
+
+    open_app(driver, url)
+    for cycle in range(cycles + 1):
+        if cycle:
+            _cycle(driver)
+        if cycle >= warmup and (cycle - warmup) % every == 0:
+            SAMPLES.append((cycle, gauges(driver)))
+
+    slopes = {key: slope([(cycle, g[key]) for cycle, g in SAMPLES]) for key in limits}
+    request.node.user_properties.append(("soak_slopes", slopes))
+    if all(k is None for k in slopes.values()):
+        pytest.skip(f"Замало вимірів ({len(SAMPLES)}): збільште --soak-cycles або зменшіть --soak-sample-every")
+    problems = [f"{key}: {k:.3f}/цикл > {limits[key]:g}" for key, k in slopes.items() if k > limits[key]]
+    assert not problems, f"Зростання за {cycles} циклів: " + "; ".join(problems)
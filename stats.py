@@ -0,0 +1,11 @@
+import statistics
+
+
+def slope(points):
+    """Нахил прямої найменших квадратів для [(x, y)]: приріст y на одиницю x. None, якщо точок менше двох."""
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
@@ -0,0 +1,33 @@
+from typing import NamedTuple
+
+_SNAPSHOT_JS = """
+const head = document.getElementById('tableHeader');
+const body = document.getElementById('tableBody');
+const text = el => el.innerText.trim();
+return {
+    headers: head ? [...head.querySelectorAll('th')].map(text) : [],
+    rows: body ? [...body.querySelectorAll('tr')].map(tr => [...tr.querySelectorAll('td')].map(text)) : [],
+};
+"""
+
+
+class TableSnapshot(NamedTuple):
+    headers: list
+    rows: list
+
+    @property
+    def header_text(self):
+        return " ".join(self.headers)
+
+    @property
+    def text(self):
+        return "\n".join(self.row_text(i) for i in range(len(self.rows)))
+
+    def row_text(self, index):
+        return " ".join(self.rows[index])
+
+
+def table_snapshot(drv):
+    """#tableHeader і #tableBody одним викликом execute_script: заголовки та текст кожної клітинки."""
+    data = drv.execute_script(_SNAPSHOT_JS)
+    return TableSnapshot(data["headers"], data["rows"])
@@ -1,28 +1,19 @@
-import time
 import pytest
-from selenium import webdriver
+import scenarios
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from helper import click_menu, add_book_helper, add_author_helper
-
-url = "http://localhost:8001/index.html"
-
-@pytest.fixture(scope="session")
-def driver():
-    opts = Options()
-    opts.add_argument("--start-maximized")
-    opts.add_argument("--headless=new")
-    drv = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    drv.implicitly_wait(3)
-    yield drv
-    drv.quit()
-
-
-def test_01_page_loads(driver):
+from helper import (unique_name, open_app, click_menu, add_book_helper, edit_book_helper, delete_book_helper,
+                    search, sort_by)
+from pages import library_page
+from registry import track
+from seed import seed_authors, seed_books
+from table import table_snapshot
+from waits import table_rows
+
+shared = pytest.mark.skipif(not scenarios.runs_in("pytest"), reason=scenarios.skip_reason("pytest"))
+
+
+@shared
+def test_01_page_loads(driver, url):
     """
     1. Сторінка відкривається, основні елементи інтерфейсу доступні.
 
@@ -32,14 +23,11 @@ def test_01_page_loads(driver):
         When користувач переходить на сторінку бібліотеки
         Then сторінка завантажується і відображаються заголовок, поле пошуку та меню
     """
-    driver.get(url)
-    assert "Библиотека" in driver.title
-    assert driver.find_element(By.TAG_NAME, "h1").is_displayed()
-    assert driver.find_element(By.ID, "mainInput").is_displayed()
-    assert driver.find_element(By.CLASS_NAME, "menu-btn").is_displayed()
+    scenarios.page_loads(driver, url)
 
 
-def test_02_switch_to_authors(driver):
+@shared
+def test_02_switch_to_authors(driver, url):
     """
     2. Перемикання на авторів змінює заголовок таблиці.
 
@@ -49,14 +37,11 @@ def test_02_switch_to_authors(driver):
         When користувач натискає кнопку "Автори"
         Then заголовок таблиці змінюється і містить колонку "Email"
     """
-    driver.get(url)
-    click_menu(driver, "Автори")
-    WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.XPATH, "//th[contains(., 'Email')]")))
-    headers = driver.find_element(By.ID, "tableHeader").text
-    assert "Email" in headers
+    scenarios.switch_to_authors(driver, url)
 
 
-def test_03_add_author(driver):
+@shared
+def test_03_add_author(driver, url):
     """
     3. Додавання автора.
 
@@ -66,17 +51,10 @@ def test_03_add_author(driver):
         When користувач додає нового автора з унікальним ім'ям та email
         Then автор з’являється у таблиці авторів
     """
-    driver.get(url)
-    click_menu(driver, "Автори")
-
-    unique_name = f"TestAuth_{int(time.time())}"
-    add_author_helper(driver, unique_name, "User", f"{unique_name}@test.com")
+    scenarios.add_author(driver, url)
 
-    page_source = driver.find_element(By.ID, "tableBody").text
-    assert unique_name in page_source
 
-
-def test_04_add_book(driver):
+def test_04_add_book(driver, url):
     """
     4. Додавання книги.
 
@@ -86,21 +64,16 @@ def test_04_add_book(driver):
         When користувач додає нову книгу з унікальною назвою
         Then книга з’являється у таблиці книг
     """
-    driver.get(url)
+    open_app(driver, url)
 
-    unique_title = f"TestBook_{int(time.time())}"
+    unique_title = unique_name("TestBook")
     add_book_helper(driver, unique_title, 2024)
 
-    headers = driver.find_element(By.ID, "tableHeader").text
-    if "Email" in headers:
-        click_menu(driver, "Книги")
-        time.sleep(0.5)
-
-    page_source = driver.find_element(By.ID, "tableBody").text
+    page_source = table_snapshot(driver).text
     assert unique_title in page_source
 
 
-def test_05_search_books(driver):
+def test_05_search_books(driver, url, seeded_books):
     """
     5. Пошук книги.
 
@@ -110,22 +83,20 @@ def test_05_search_books(driver):
         When користувач вводить назву книги у поле пошуку
         Then таблиця відображає цю книгу
     """
-    driver.get(url)
+    open_app(driver, url)
 
-    target_book = f"FindMe_{int(time.time())}"
-    add_book_helper(driver, target_book, 2025)
+    target_book, = seeded_books(prefix="FindMe", year=2025)
 
-    inp = driver.find_element(By.ID, "mainInput")
-    inp.clear()
-    inp.send_keys(target_book)
-    time.sleep(1)
+    search(driver, target_book)
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
-    assert len(rows) > 0
-    assert target_book in rows[0].text
+    table = table_snapshot(driver)
+    assert len(table.rows) > 0
+    assert target_book in table.row_text(0)
 
 
-def test_06_sort_books(driver):
+# Перевіряє порядок усієї таблиці книг, а не лише власних записів.
+@pytest.mark.library(data=("book-order",))
+def test_06_sort_books(driver, url):
     """
     6. Сортування книг за роком.
 
@@ -135,23 +106,21 @@ def test_06_sort_books(driver):
         When користувач натискає на заголовок колонки "Рік"
         Then порядок книг змінюється після кліку
     """
-    driver.get(url)
+    open_app(driver, url)
 
-    add_book_helper(driver, "AAA_SortBook", 1000)
-    add_book_helper(driver, "ZZZ_SortBook", 3000)
+    seed_books(driver, [{"title": unique_name("AAA_SortBook"), "year": 1000},
+                        {"title": unique_name("ZZZ_SortBook"), "year": 3000}])
 
-    driver.find_element(By.XPATH, "//th[contains(., 'Рік')]").click()
-    time.sleep(0.5)
-    first_row_text_asc = driver.find_element(By.CSS_SELECTOR, "#tableBody tr:first-child").text
+    sort_by(driver, "Рік")
+    first_row_text_asc = table_snapshot(driver).row_text(0)
 
-    driver.find_element(By.XPATH, "//th[contains(., 'Рік')]").click()
-    time.sleep(0.5)
-    first_row_text_desc = driver.find_element(By.CSS_SELECTOR, "#tableBody tr:first-child").text
+    sort_by(driver, "Рік")
+    first_row_text_desc = table_snapshot(driver).row_text(0)
 
     assert first_row_text_asc != first_row_text_desc, "Порядок рядків не змінився після кліку на сортування!"
 
 
-def test_07_delete_book(driver):
+def test_07_delete_book(driver, url, seeded_books):
     """
     7. Видалення книги.
 
@@ -161,33 +130,20 @@ def test_07_delete_book(driver):
         When користувач видаляє цю книгу
         Then книга більше не відображається у таблиці
     """
-    driver.get(url)
-
-    del_title = f"DeleteMe_{int(time.time())}"
-    add_book_helper(driver, del_title, 2020)
+    open_app(driver, url)
 
-    driver.find_element(By.ID, "mainInput").clear()
-    driver.find_element(By.ID, "mainInput").send_keys(del_title)
-    time.sleep(0.5)
+    del_title, = seeded_books(prefix="DeleteMe", year=2020)
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
-    if len(rows) == 0:
-        pytest.fail("Книга для видалення не знайдена")
+    delete_book_helper(driver, del_title)
 
-    rows[0].find_element(By.CLASS_NAME, "del-btn").click()
-    WebDriverWait(driver, 3).until(EC.alert_is_present()).accept()
-    time.sleep(1)
+    search(driver, del_title)
 
-    driver.find_element(By.ID, "mainInput").clear()
-    driver.find_element(By.ID, "mainInput").send_keys(del_title)
-    time.sleep(0.5)
-
-    rows_after = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
+    rows_after = table_snapshot(driver).rows
     if len(rows_after) > 0:
-        assert del_title not in rows_after[0].text
+        assert del_title not in " ".join(rows_after[0])
 
 
-def test_08_edit_book(driver):
+def test_08_edit_book(driver, url, seeded_books):
     """
     8. Редагування книги.
 
@@ -197,40 +153,23 @@ def test_08_edit_book(driver):
         When користувач змінює назву книги
         Then нова назва відображається у таблиці
     """
-    driver.get(url)
+    open_app(driver, url)
 
-    old_title = f"EditMe_{int(time.time())}"
-    new_title = f"Edited_{int(time.time())}"
-    add_book_helper(driver, old_title, 2021)
+    old_title, = seeded_books(prefix="EditMe", year=2021)
+    new_title = unique_name("Edited")
 
-    driver.find_element(By.ID, "mainInput").clear()
-    driver.find_element(By.ID, "mainInput").send_keys(old_title)
+    edit_book_helper(driver, old_title, new_title)
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
-    if not rows: pytest.fail("Не знайшли книгу для редагування")
+    search(driver, new_title)
 
-    rows[0].find_element(By.CLASS_NAME, "edit-btn").click()
-    WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.ID, "bookModal")))
+    table = table_snapshot(driver)
+    assert len(table.rows) > 0
+    assert new_title in table.row_text(0)
 
-    title_field = driver.find_element(By.ID, "bookTitle")
-    title_field.clear()
-    title_field.send_keys(new_title)
+    delete_book_helper(driver, new_title)
 
-    driver.find_element(By.CSS_SELECTOR, "#bookModal .save-btn").click()
-    WebDriverWait(driver, 3).until(EC.invisibility_of_element_located((By.ID, "bookModal")))
 
-    driver.find_element(By.ID, "mainInput").clear()
-    driver.find_element(By.ID, "mainInput").send_keys(new_title)
-
-    rows_new = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
-    assert len(rows_new) > 0
-    assert new_title in rows_new[0].text
-
-    rows_new[0].find_element(By.CLASS_NAME, "del-btn").click()
-    WebDriverWait(driver, 3).until(EC.alert_is_present()).accept()
-
-
-def test_09_search_non_existent_book(driver):
+def test_09_search_non_existent_book(driver, url):
     """
     9. Пошук неіснуючої книги.
 
@@ -240,16 +179,15 @@ def test_09_search_non_existent_book(driver):
         When користувач вводить назву у поле пошуку
         Then таблиця не відображає жодного результату
     """
-    driver.get(url)
+    open_app(driver, url)
 
-    driver.find_element(By.ID, "mainInput").send_keys("АбраКадабра12345")
-    time.sleep(1)
+    search(driver, "АбраКадабра12345")
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
+    rows = table_snapshot(driver).rows
     assert len(rows) == 0, "Пошук мав повернути 0 результатів"
 
 
-def test_10_add_author_empty_fields(driver):
+def test_10_add_author_empty_fields(driver, url):
     """
     10. Негативний сценарій: Спроба додати автора з порожніми обов'язковими полями.
 
@@ -259,26 +197,24 @@ def test_10_add_author_empty_fields(driver):
         When користувач залишає поле "Ім'я" порожнім і натискає "Зберегти"
         Then автор не повинен з'явитися в таблиці
     """
-    driver.get(url)
+    open_app(driver, url)
     click_menu(driver, "Автори")
 
-    unique_email = f"empty_{int(time.time())}@test.com"
+    unique_email = f"{unique_name('empty')}@test.com"
+    track(driver, "author", unique_email)
 
-    click_menu(driver, "Додати автора")
-    WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.ID, "authorModal")))
+    modal = library_page(driver).author_modal
+    modal.open()
 
-    driver.find_element(By.ID, "authEmail").send_keys(unique_email)
-    driver.find_element(By.ID, "authAge").send_keys("25")
+    modal.fill(typing=True, email=unique_email, age=25)
 
-    driver.find_element(By.CSS_SELECTOR, "#authorModal .save-btn").click()
-    WebDriverWait(driver, 3).until(EC.invisibility_of_element_located((By.ID, "authorModal")))
-    time.sleep(1)
+    modal.save()
 
-    page_source = driver.find_element(By.ID, "tableBody").text
+    page_source = table_snapshot(driver).text
     assert unique_email not in page_source, "Автор з порожнім іменем був створений"
 
 
-def test_11_add_book_invalid_year(driver):
+def test_11_add_book_invalid_year(driver, url):
     """
     11. Негативний сценарій: Спроба додати книгу з некоректним роком (наприклад, -500).
 
@@ -288,38 +224,25 @@ def test_11_add_book_invalid_year(driver):
         When користувач вводить рік "-500"
         Then книга не повинна з'явитися в таблиці
     """
-    driver.get(url)
-    if "Email" in driver.find_element(By.ID, "tableHeader").text:
-        click_menu(driver, "Книги")
-
-    invalid_title = f"InvalidYearBook_{int(time.time())}"
+    open_app(driver, url)
 
-    click_menu(driver, "Додати книгу")
-    WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.ID, "bookModal")))
+    invalid_title = unique_name("InvalidYearBook")
+    track(driver, "book", invalid_title)
 
-    driver.find_element(By.ID, "bookTitle").send_keys(invalid_title)
-    driver.find_element(By.ID, "bookYear").send_keys("-500")
+    modal = library_page(driver).book_modal
+    modal.open()
 
-    try:
-        select = driver.find_element(By.ID, "bookAuthorSelect")
-        options = select.find_elements(By.TAG_NAME, "option")
-        if options: options[0].click()
-    except:
-        pass
+    modal.fill(typing=True, title=invalid_title, year=-500, author=None)
 
-    driver.find_element(By.CSS_SELECTOR, "#bookModal .save-btn").click()
-    WebDriverWait(driver, 3).until(EC.invisibility_of_element_located((By.ID, "bookModal")))
-    time.sleep(1)
+    modal.save()
 
-    driver.find_element(By.ID, "mainInput").clear()
-    driver.find_element(By.ID, "mainInput").send_keys(invalid_title)
-    time.sleep(1)
+    search(driver, invalid_title)
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
+    rows = table_snapshot(driver).rows
     assert len(rows) == 0, "Книга з від'ємним роком була створена"
 
 
-def test_12_update_author_reflects_on_book(driver):
+def test_12_update_author_reflects_on_book(driver, url):
     """
     12. End-to-End сценарій: Відображення змін у пов'язаних сутностях.
     Змінюємо ім'я автора і перевіряємо, чи оновилося воно в таблиці книг.
@@ -330,61 +253,38 @@ def test_12_update_author_reflects_on_book(driver):
         When користувач змінює ім'я автора на "NewName"
         Then у списку книг автор тепер відображається як "NewName"
     """
-    driver.get(url)
-    timestamp = int(time.time())
-    old_name = f"OldName_{timestamp}"
-    new_name = f"NewName_{timestamp}"
-    unique_email = f"update_{timestamp}@test.com"
-
-    add_author_helper(driver, old_name, "Test", unique_email)
-
-    book_title = f"ReflectBook_{timestamp}"
-
-    click_menu(driver, "Додати книгу")
-    WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.ID, "bookModal")))
-
-    driver.find_element(By.ID, "bookTitle").send_keys(book_title)
-    driver.find_element(By.ID, "bookYear").send_keys("2024")
-
-    select = driver.find_element(By.ID, "bookAuthorSelect")
-    time.sleep(0.5)
-    for option in select.find_elements(By.TAG_NAME, "option"):
-        if old_name in option.text:
-            option.click()
-            break
+    open_app(driver, url)
+    old_name = unique_name("OldName")
+    new_name = unique_name("NewName")
+    unique_email = f"{unique_name('update')}@test.com"
+    book_title = unique_name("ReflectBook")
+    track(driver, "author", new_name)
 
-    driver.find_element(By.CSS_SELECTOR, "#bookModal .save-btn").click()
-    WebDriverWait(driver, 3).until(EC.invisibility_of_element_located((By.ID, "bookModal")))
+    seed_authors(driver, [{"first": old_name, "last": "Test", "email": unique_email}])
+    seed_books(driver, [{"title": book_title, "year": 2024, "author": old_name}])
 
     click_menu(driver, "Автори")
-    driver.find_element(By.ID, "mainInput").clear()
-    driver.find_element(By.ID, "mainInput").send_keys(old_name)
-    time.sleep(1)
+    search(driver, old_name)
 
-    rows = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
+    rows = table_rows(driver)
     if not rows:
         pytest.fail("Автора для редагування не знайдено")
 
     rows[0].find_element(By.CLASS_NAME, "edit-btn").click()
-    WebDriverWait(driver, 3).until(EC.visibility_of_element_located((By.ID, "authorModal")))
+    modal = library_page(driver).author_modal
+    modal.wait_open()
 
-    name_field = driver.find_element(By.ID, "authFirstName")
-    name_field.clear()
-    name_field.send_keys(new_name)
+    modal.fill(first_name=new_name)
 
-    driver.find_element(By.CSS_SELECTOR, "#authorModal .save-btn").click()
-    WebDriverWait(driver, 3).until(EC.invisibility_of_element_located((By.ID, "authorModal")))
-    time.sleep(1)
+    modal.save()
 
     click_menu(driver, "Книги")
-    driver.find_element(By.ID, "mainInput").clear()
-    driver.find_element(By.ID, "mainInput").send_keys(book_title)
-    time.sleep(1)
+    search(driver, book_title)
 
-    book_rows = driver.find_elements(By.CSS_SELECTOR, "#tableBody tr")
+    book_rows = table_snapshot(driver).rows
     assert len(book_rows) > 0, "Книга не знайдена"
 
-    author_col_text = book_rows[0].find_elements(By.TAG_NAME, "td")[3].text
+    author_col_text = book_rows[0][3]
 
     assert new_name in author_col_text, f"Ім'я автора в книзі не оновилося. Очікувалось {new_name}, є {author_col_text}"
     assert old_name not in author_col_text, "Старе ім'я все ще відображається"
\ No newline at end of file
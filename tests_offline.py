@@ -0,0 +1,112 @@
+"""
+Перевірки логіки без браузера: pytest tests_offline.py.
+
+Планувальник (scheduler.py), перцентилі й регресії bench.py і нахил з stats.py -- чисті
+функції, тож їх можна перевірити без Chrome і застосунку.
+"""
+import pytest
+from bench import growth_exponent, percentiles, regressions
+from scheduler import cost, parse_shard, shard, shuffle, units
+from stats import slope
+
+
+class FakeItem:
+    """Мінімум pytest.Item, який потрібен scheduler: nodeid і маркер library."""
+
+    def __init__(self, nodeid, data=()):
+        self.nodeid = nodeid
+        self._marker = pytest.mark.library(data=data).mark if data else None
+
+    def get_closest_marker(self, name):
+        return self._marker if name == "library" else None
+
+    def __repr__(self):
+        return self.nodeid
+
+
+def _ids(unit_list):
+    return [[item.nodeid for item in unit] for unit in unit_list]
+
+
+def _shard_ids(shards):
+    """Шард -> плаский список nodeid у порядку запуску."""
+    return [[nodeid for unit in _ids(s) for nodeid in unit] for s in shards]
+
+
+def test_units_keep_shared_data_together():
+    items = [FakeItem("a", ("authors",)), FakeItem("b"), FakeItem("c", ("books",)),
+             FakeItem("d", ("books", "authors")), FakeItem("e")]
+    # a і c не мають спільного ресурсу напряму, але обидва ділять дані з d.
+    assert _ids(units(items)) == [["a", "c", "d"], ["b"], ["e"]]
+
+
+def test_cost_uses_mean_duration_for_unknown_tests():
+    durations = {"a": 2.0, "b": 4.0}
+    assert cost([FakeItem("a"), FakeItem("x")], durations) == 5.0
+    assert cost([FakeItem("x")], {}) == 1.0
+
+
+def test_shard_balances_load_and_keeps_order():
+    durations = {"t1": 5, "t2": 4, "t3": 3, "t4": 3, "t5": 2, "t6": 1}
+    unit_list = [[FakeItem(nodeid)] for nodeid in durations]
+    shards = shard(unit_list, durations, 2)
+
+    assert sorted(nodeid for s in _shard_ids(shards) for nodeid in s) == sorted(durations)
+    assert [sum(cost(unit, durations) for unit in s) for s in shards] == [9, 9]
+    for s in _shard_ids(shards):
+        assert s == sorted(s)
+
+
+def test_shard_never_splits_a_unit():
+    items = [FakeItem("a", ("books",)), FakeItem("b"), FakeItem("c", ("books",)), FakeItem("d")]
+    shards = shard(units(items), {}, 3)
+    homes = {nodeid: index for index, s in enumerate(_shard_ids(shards)) for nodeid in s}
+    assert homes["a"] == homes["c"]
+    assert len(shards) == 3
+
+
+def test_shuffle_is_reproducible_by_seed():
+    items = [FakeItem(f"t{i}", (f"group{i // 3}",)) for i in range(12)]
+    unit_list = units(items)
+    first = _ids(shuffle(unit_list, 42))
+
+    assert first == _ids(shuffle(unit_list, 42))
+    assert first != _ids(shuffle(unit_list, 43))
+    # Перемішуються і групи, і тести в них, але склад груп не змінюється.
+    assert sorted(sorted(unit) for unit in first) == sorted(sorted(unit) for unit in _ids(unit_list))
+    assert _ids(unit_list) == [[f"t{i}" for i in range(g, g + 3)] for g in range(0, 12, 3)]
+
+
+@pytest.mark.parametrize("value, expected", [("1/1", (0, 1)), ("2/4", (1, 4)), ("4/4", (3, 4))])
+def test_parse_shard(value, expected):
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0/4", "5/4", "1/0", "-1/4", "2", "1/2/3", "a/b", ""])
+def test_parse_shard_rejects_bad_values(value):
+    with pytest.raises(ValueError):
+        parse_shard(value)
+
+
+def test_percentiles():
+    stats = percentiles(list(range(1, 102)))
+    assert stats == {"p50": 51, "p90": 91, "p99": 100, "max": 101}
+
+
+def test_regressions_compare_p50_and_p90_with_tolerance():
+    baseline = {"p50": 100.0, "p90": 200.0, "p99": 1.0}
+    assert regressions({"p50": 120.0, "p90": 240.0, "p99": 999.0}, baseline, 0.2) == []
+    problems = regressions({"p50": 121.0, "p90": 200.0, "p99": 1.0}, baseline, 0.2)
+    assert len(problems) == 1 and problems[0].startswith("p50:")
+    assert regressions({"p50": 500.0, "p90": 500.0}, {}, 0.2) == []
+
+
+def test_slope():
+    assert slope([(0, 1), (1, 3), (2, 5), (3, 7)]) == pytest.approx(2.0)
+    assert slope([(0, 5), (10, 5)]) == 0
+    assert slope([(1, 1)]) is None
+
+
+def test_growth_exponent():
+    assert growth_exponent([(n, 0.5 * n ** 2) for n in (1000, 10000, 100000)]) == pytest.approx(2.0)
+    assert growth_exponent([(1000, 10.0)]) is None
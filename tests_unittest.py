@@ -1,66 +1,82 @@
+import os
+import threading
 import unittest
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from helper import click_menu, add_author_helper
+import artifacts
+import scenarios
+from pool import ParallelSuite
+from session import LibrarySession
 
-URL = "http://localhost:8001/index.html"
+WORKERS = int(os.environ.get("UI_WORKERS", "1"))
 
+# Власна сесія -- лише для запуску через unittest (python tests_unittest.py або -m unittest).
+# Під pytest TestLibraryUI отримує library_session і browser з conftest.py.
+_session = None
+_session_lock = threading.Lock()
 
-class TestLibraryUI(unittest.TestCase):
 
-    @classmethod
-    def setUpClass(cls):
-        opts = Options()
-        opts.add_argument("--start-maximized")
-        opts.add_argument("--headless=new")
-        cls.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-        cls.driver.implicitly_wait(3)
+def _local_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = LibrarySession(workers=WORKERS).start()
+        return _session
 
-    @classmethod
-    def tearDownClass(cls):
-        cls.driver.quit()
 
-    def test_01_page_loads(self):
-        """1. Сторінка відкривається, основні елементи інтерфейсу доступні."""
-        self.driver.get(URL)
+def setUpModule():
+    if not scenarios.runs_in("unittest"):
+        raise unittest.SkipTest(scenarios.skip_reason("unittest"))
 
-        self.assertIn("Библиотека", self.driver.title)
-        self.assertTrue(self.driver.find_element(By.TAG_NAME, "h1").is_displayed())
-        self.assertTrue(self.driver.find_element(By.ID, "mainInput").is_displayed())
-        self.assertTrue(self.driver.find_element(By.CLASS_NAME, "menu-btn").is_displayed())
 
-    def test_02_switch_to_authors(self):
-        """2. Перемикання на авторів змінює заголовок таблиці."""
-        self.driver.get(URL)
+def tearDownModule():
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
 
-        click_menu(self.driver, "Автори")
 
-        WebDriverWait(self.driver, 5).until(
-            EC.presence_of_element_located((By.XPATH, "//th[contains(., 'Email')]"))
-        )
+class TestLibraryUI(unittest.TestCase):
+    # Під pytest їх виставляє фікстура unittest_session з conftest.py.
+    session = None
+    browser = None
+    artifacts_dir = None
+
+    def setUp(self):
+        if self.browser is not None:
+            self.driver = self.browser
+        else:
+            self.session = _local_session()
+            self.driver = self.session.acquire()
+        self.url = self.session.url
+
+    def tearDown(self):
+        if artifacts.failed(self):
+            artifacts.capture(self.driver, self.id(), self.artifacts_dir)
+        if self.browser is None:
+            self.session.release(self.driver)
 
-        headers = self.driver.find_element(By.ID, "tableHeader").text
-        self.assertIn("Email", headers)
+    def test_01_page_loads(self):
+        """1. Сторінка відкривається, основні елементи інтерфейсу доступні."""
+        scenarios.page_loads(self.driver, self.url)
+
+    def test_02_switch_to_authors(self):
+        """2. Перемикання на авторів змінює заголовок таблиці."""
+        scenarios.switch_to_authors(self.driver, self.url)
 
     def test_03_add_author(self):
         """3. Додавання автора."""
-        self.driver.get(URL)
-        click_menu(self.driver, "Автори")
-
-        unique_name = f"TestAuth_{int(time.time())}"
-
-        add_author_helper(self.driver, unique_name, "User", f"{unique_name}@test.com")
-
-        page_source = self.driver.find_element(By.ID, "tableBody").text
-
-        self.assertIn(unique_name, page_source)
+        scenarios.add_author(self.driver, self.url)
 
 
 if __name__ =="__main__":
-    unittest.main(verbosity=2)
\ No newline at end of file
+    if WORKERS > 1:
+        # UI_WORKERS=4 python tests_unittest.py -- тести розподіляються між 4 браузерами пулу.
+        suite = ParallelSuite(unittest.defaultTestLoader.loadTestsFromTestCase(TestLibraryUI), workers=WORKERS)
+        try:
+            setUpModule()
+            unittest.TextTestRunner(verbosity=1).run(suite)
+        except unittest.SkipTest as e:
+            print(f"skipped: {e}")
+        finally:
+            tearDownModule()
+    else:
+        unittest.main(verbosity=2)
@@ -0,0 +1,165 @@
+import csv
+import functools
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from selenium.common.exceptions import NoSuchElementException
+
+# kind: "test" -- весь тест, "step" -- хелпер, "wait" -- явне очікування (WebDriverWait),
+# "command" -- команда WebDriver, "empty_lookup" -- find_element(s), що нічого не знайшов
+# (implicit wait вимкнено, тож це лише час самої команди), "sleep" -- time.sleep поза явними очікуваннями.
+# budget -- тайм-аут очікування (секунди) або None.
+RECORDS = []
+
+# Скільки останніх команд кожен драйвер тримає в drv.command_log (для artifacts.capture).
+COMMAND_LOG_SIZE = 200
+
+_lock = threading.Lock()
+_local = threading.local()
+_real_sleep = time.sleep
+
+
+def current_test():
+    return getattr(_local, "test", None)
+
+
+def record(name, kind, seconds, budget=None):
+    with _lock:
+        RECORDS.append({"test": current_test(), "step": name, "kind": kind, "seconds": seconds, "budget": budget})
+
+
+@contextmanager
+def step(name, kind="step", budget=None):
+    outer = getattr(_local, "kind", None)
+    _local.kind = kind
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, kind, time.perf_counter() - t0, budget)
+        _local.kind = outer
+
+
+@contextmanager
+def in_test(name):
+    _local.test = name
+    try:
+        with step(name, "test"):
+            yield
+    finally:
+        _local.test = None
+
+
+def timed(func=None, *, name=None, kind="step"):
+    """Декоратор: записує час виконання функції як крок name (за замовчуванням -- ім'я функції)."""
+    if func is None:
+        return functools.partial(timed, name=name, kind=kind)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with step(name or func.__name__, kind):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _timed_sleep(seconds):
+    # Опитування всередині WebDriverWait вже враховане як "wait".
+    if getattr(_local, "kind", None) == "wait":
+        return _real_sleep(seconds)
+    with step("time.sleep", "sleep"):
+        _real_sleep(seconds)
+
+
+def patch_sleep():
+    time.sleep = _timed_sleep
+
+
+def unpatch_sleep():
+    time.sleep = _real_sleep
+
+
+def _brief(params):
+    # Лише те, що коротке і допомагає впізнати команду; тексти скриптів не зберігаються.
+    if not params:
+        return None
+    if "using" in params:
+        return f"{params['using']}={params.get('value')}"
+    return params.get("url") or params.get("cmd")
+
+
+def instrument(drv):
+    """
+    Обгортає drv.execute, щоб кожна команда WebDriver записувалась окремим кроком.
+
+    Останні COMMAND_LOG_SIZE команд додатково лежать у кільцевому буфері drv.command_log:
+    (час початку, команда, короткий опис параметрів, секунди, "ok" або назва винятку).
+    """
+    execute = drv.execute
+    log = drv.command_log = deque(maxlen=COMMAND_LOG_SIZE)
+
+    def timed_execute(driver_command, params=None):
+        started = time.time()
+        t0 = time.perf_counter()
+        kind = "command"
+        status = "ok"
+        try:
+            response = execute(driver_command, params)
+            if driver_command == "findElements" and not response.get("value"):
+                kind = "empty_lookup"
+            return response
+        except NoSuchElementException:
+            kind = "empty_lookup"
+            status = "NoSuchElementException"
+            raise
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - t0
+            record(f"driver.{driver_command}", kind, seconds)
+            log.append((started, driver_command, _brief(params), seconds, status))
+
+    drv.execute = timed_execute
+    return drv
+
+
+def by_step(records=None):
+    """
+    {step: {"kind", "count", "total", "max", "max_used"}} для всіх кроків, крім цілих тестів.
+
+    max_used -- найбільша частка тайм-ауту (seconds / budget), яку з'їло очікування; None без budget.
+    """
+    stats = defaultdict(lambda: {"kind": None, "count": 0, "total": 0.0, "max": 0.0, "max_used": None})
+    for r in RECORDS if records is None else records:
+        if r["kind"] == "test":
+            continue
+        s = stats[r["step"]]
+        s["kind"] = r["kind"]
+        s["count"] += 1
+        s["total"] += r["seconds"]
+        s["max"] = max(s["max"], r["seconds"])
+        if r.get("budget"):
+            s["max_used"] = max(s["max_used"] or 0.0, r["seconds"] / r["budget"])
+    return dict(stats)
+
+
+def by_kind(records=None):
+    totals = defaultdict(float)
+    for r in RECORDS if records is None else records:
+        totals[r["kind"]] += r["seconds"]
+    return dict(totals)
+
+
+def dump(path, records=None):
+    records = RECORDS if records is None else records
+    if str(path).endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["test", "step", "kind", "seconds", "budget"])
+            writer.writeheader()
+            writer.writerows(records)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"records": records, "steps": by_step(records), "kinds": by_kind(records)},
+                      f, ensure_ascii=False, indent=2)
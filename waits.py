@@ -0,0 +1,173 @@
+import os
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from timing import step
+
+# Базові тайм-аути, секунди. Фактичні -- budget(...): помножені на SCALE, який
+# calibration.calibrate виміряв на старті сесії, тож на повільному CI вони довші,
+# а на швидкій машині коротші. LIBRARY_TIMEOUT_SCALE задає SCALE вручну.
+SCALE = float(os.environ.get("LIBRARY_TIMEOUT_SCALE", 1.0))
+MENU_TIMEOUT = 2
+MODAL_TIMEOUT = 3
+FIND_TIMEOUT = 3
+HEADER_TIMEOUT = 5
+RENDER_TIMEOUT = 3
+CHANGE_TIMEOUT = 1
+POLL = 0.05
+QUIET = 0.15
+
+# Очікування в браузері без опитування через WebDriver: умова перевіряється одразу,
+# а далі -- лише на зміни DOM (MutationObserver) і на завершення CSS-переходів/анімацій,
+# які мутацій не створюють. Результат повертається одним execute_async_script.
+_OBSERVE_JS = """
+const [args, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const predicate = () => { __PREDICATE__ };
+const events = ['transitionend', 'transitioncancel', 'animationend', 'animationcancel'];
+let finished = false;
+const finish = value => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    events.forEach(e => document.removeEventListener(e, check, true));
+    clearTimeout(timer);
+    done(value);
+};
+const check = () => { try { if (predicate()) finish(true); } catch (e) { finish(String(e)); } };
+const observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+events.forEach(e => document.addEventListener(e, check, true));
+const timer = setTimeout(() => { try { finish(!!predicate()); } catch (e) { finish(String(e)); } }, timeout);
+check();
+"""
+
+_VISIBLE_JS = ("const el = document.getElementById(args[0]); "
+               "const shown = !!el && el.checkVisibility({opacityProperty: true, visibilityProperty: true});")
+
+# Спостерігач, встановлений до дії, фіксує мутації #tableBody, що сталися ще до wait_table_settled.
+# Стан лишається в сторінці: вміст таблиці не передається в Python і назад.
+_MARK_TABLE_JS = """
+const body = document.getElementById('tableBody');
+const old = window.__tableWatch;
+if (old) old.observer.disconnect();
+const watch = window.__tableWatch = {last: null, observer: new MutationObserver(() => { watch.last = performance.now(); })};
+if (body) watch.observer.observe(body, {childList: true, subtree: true, characterData: true, attributes: true});
+"""
+
+_SETTLE_JS = """
+const [marked, changeTimeout, quiet, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const body = document.getElementById('tableBody');
+const watch = window.__tableWatch;
+const t0 = performance.now();
+let last = watch ? watch.last : null;
+const changed = !marked || last !== null;
+const observer = new MutationObserver(() => { last = performance.now(); });
+if (watch) watch.observer.disconnect();
+window.__tableWatch = null;
+if (body) observer.observe(body, {childList: true, subtree: true, characterData: true, attributes: true});
+(function check() {
+    const now = performance.now();
+    const seen = changed || last !== null;
+    let result = null;
+    if (seen && now - (last ?? t0) >= quiet) result = true;
+    else if (!seen && now - t0 >= changeTimeout) result = true;
+    else if (now - t0 >= timeout) result = false;
+    if (result === null) { setTimeout(check, 10); return; }
+    observer.disconnect();
+    done(result);
+})();
+"""
+
+
+def budget(seconds):
+    """Тайм-аут для поточного середовища: базове значення, помножене на SCALE."""
+    return seconds * SCALE
+
+
+class _TimedWait(WebDriverWait):
+    def until(self, method, message=""):
+        name = getattr(method, "__qualname__", type(method).__name__).split(".")[0]
+        with step(f"wait:{name}", "wait", budget=self._timeout):
+            return super().until(method, message)
+
+
+def wait(drv, timeout):
+    """WebDriverWait з каліброваним тайм-аутом: timeout -- базове значення (MODAL_TIMEOUT тощо)."""
+    return _TimedWait(drv, budget(timeout), poll_frequency=POLL)
+
+
+def wait_for_dom(drv, predicate_js, *args, timeout, name):
+    """
+    Чекає в браузері, поки predicate_js (тіло функції; аргументи доступні як args) не поверне true.
+
+    Умова перевіряється на кожну мутацію DOM і кожен transitionend/animationend,
+    тож очікування закінчується в момент зміни, без інтервалу опитування і без
+    додаткових команд WebDriver.
+    """
+    script = _OBSERVE_JS.replace("__PREDICATE__", predicate_js)
+    timeout = budget(timeout)
+    with step(f"wait:{name}", "wait", budget=timeout):
+        result = drv.execute_async_script(script, list(args), int(timeout * 1000))
+    if result is not True:
+        raise TimeoutException(f"{name}: {result if isinstance(result, str) else f'not met within {timeout:.2f}s'}")
+
+
+def wait_dropdown_open(drv, timeout=MENU_TIMEOUT):
+    wait_for_dom(drv, "const d = document.getElementById('dropdown'); return !!d && d.classList.contains('active');",
+                 timeout=timeout, name="dropdown_open")
+
+
+def wait_modal_open(drv, modal_id, timeout=MODAL_TIMEOUT):
+    """Модальне вікно видиме, повністю непрозоре і не має активних CSS-анімацій."""
+    wait_for_dom(drv, _VISIBLE_JS + """
+        return shown && getComputedStyle(el).opacity === '1'
+            && el.getAnimations({subtree: true}).every(a => a.playState !== 'running');
+    """, modal_id, timeout=timeout, name="modal_open")
+
+
+def wait_modal_closed(drv, modal_id, timeout=MODAL_TIMEOUT):
+    wait_for_dom(drv, _VISIBLE_JS + " return !shown;", modal_id, timeout=timeout, name="modal_closed")
+
+
+def mark_table(drv):
+    """Починає стежити за #tableBody перед дією; після дії -- wait_table_settled(drv, marked=True)."""
+    drv.execute_script(_MARK_TABLE_JS)
+
+
+def wait_table_settled(drv, marked=False, timeout=RENDER_TIMEOUT):
+    """
+    Чекає, поки таблиця перемалюється після дії і перестане змінюватись протягом QUIET.
+
+    marked=True -- перед дією викликано mark_table(). Якщо дія таблицю не зачепила
+    (спостерігач не зафіксував жодної мутації), очікування першої зміни обмежене CHANGE_TIMEOUT.
+    Без marked -- чекає лише тиші QUIET.
+    """
+    timeout = budget(timeout)
+    with step("wait:table_settled", "wait", budget=timeout):
+        settled = drv.execute_async_script(_SETTLE_JS, marked, int(budget(CHANGE_TIMEOUT) * 1000),
+                                           int(QUIET * 1000), int(timeout * 1000))
+    if not settled:
+        raise TimeoutException(f"#tableBody kept changing for {timeout:.2f}s")
+
+
+def find(drv, by, value, timeout=FIND_TIMEOUT):
+    """
+    find_element з явним очікуванням появи елемента.
+
+    Драйвер працює без implicit wait, тож очікування є лише там, де елемент
+    справді має з'явитися; якщо він уже в DOM, повертається з першої ж спроби.
+    """
+    return wait(drv, timeout).until(EC.presence_of_element_located((by, value)))
+
+
+def find_all(drv, by, value):
+    """find_elements без очікування: порожній список повертається одразу."""
+    return drv.find_elements(by, value)
+
+
+def table_rows(drv):
+    """Рядки #tableBody; викликати після дії, що вже дочекалась wait_table_settled (search, sort_by, modal.save())."""
+    return find_all(drv, By.CSS_SELECTOR, "#tableBody tr")